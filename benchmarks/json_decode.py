@@ -0,0 +1,63 @@
+"""
+Compares the old ``json_or_text`` decoding path (bytes -> str -> json.loads)
+with the bytes-level path used today, on realistic payload sizes.
+
+Run with ``python benchmarks/json_decode.py``. Install ``orjson`` to include
+the fast backend.
+"""
+
+import json
+import random
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from payloads import make_leaderboard, make_match, make_match_stats
+
+from faceit.utils import HAS_ORJSON, _from_json
+
+
+def decode_via_text(body: bytes) -> Any:
+    return json.loads(body.decode("utf-8"))
+
+
+def decode_bytes_stdlib(body: bytes) -> Any:
+    return json.loads(body)
+
+
+def peak_allocation(func: Callable[[bytes], Any], body: bytes) -> int:
+    tracemalloc.start()
+    try:
+        func(body)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    payloads = {
+        "match": make_match(rng),
+        "match_stats (bo3)": make_match_stats(rng, rounds=3),
+        "leaderboard (1000)": make_leaderboard(rng, size=1000),
+    }
+    decoders: Dict[str, Callable[[bytes], Any]] = {
+        "str + json.loads": decode_via_text,
+        "bytes json.loads": decode_bytes_stdlib,
+    }
+    if HAS_ORJSON:
+        decoders["bytes orjson"] = _from_json
+
+    print(f"{'payload':<20} {'decoder':<18} {'size':>9} {'time/op':>11} {'peak alloc':>11}")
+    for name, payload in payloads.items():
+        body = json.dumps(payload).encode("utf-8")
+        for decoder_name, decoder in decoders.items():
+            timer = timeit.Timer(lambda: decoder(body))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=5, number=number)) / number
+            peak = peak_allocation(decoder, body)
+            print(f"{name:<20} {decoder_name:<18} {len(body):>9} {best * 1e6:>9.1f}us {peak / 1024:>9.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+A local aiohttp server imitating the FACEIT Data API for the benchmarks.
+
+It serves synthetic payloads from :mod:`payloads` under the same paths as
+``https://open.faceit.com/data/v4`` and can inject latency, 429 responses
+with ``Retry-After`` and bursts of 5xx errors. No network access is needed.
+
+Run it standalone with ``python benchmarks/mock_server.py --port 8080``.
+"""
+
+import argparse
+import asyncio
+import random
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aiohttp import web
+from payloads import make_leaderboard, make_match, make_match_stats, make_player
+
+from faceit.utils import _to_json
+
+
+class MockConfig:
+    """Fault injection settings of the mock server.
+
+    Parameters
+    ----------
+    latency: :class:`float`
+        Base delay of every response in seconds.
+    jitter: :class:`float`
+        Additional uniformly random delay in seconds.
+    rate_limit_probability: :class:`float`
+        Probability of answering with 429.
+    retry_after: :class:`float`
+        The ``Retry-After`` value sent with 429 responses.
+    error_burst_every: :class:`int`
+        Start a burst of 503 responses every N requests. 0 disables bursts.
+    error_burst_length: :class:`int`
+        The number of consecutive requests a burst fails.
+    seed: :class:`int`
+        Seed for the fault injection and the payloads.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after: float = 0.05,
+        error_burst_every: int = 0,
+        error_burst_length: int = 0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after = retry_after
+        self.error_burst_every = error_burst_every
+        self.error_burst_length = error_burst_length
+        self.seed = seed
+
+
+class MockFaceitAPI:
+    def __init__(self, config: Optional[MockConfig] = None) -> None:
+        self.config = config or MockConfig()
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self._rng = random.Random(self.config.seed)
+        self._bodies: Dict[str, bytes] = {}
+
+    def _body(self, key: str, factory: Callable[[random.Random], Any]) -> bytes:
+        # Payloads are deterministic per key and encoded once, so the server stays cheap
+        body = self._bodies.get(key)
+        if body is None:
+            rng = random.Random(zlib.crc32(key.encode()) ^ self.config.seed)
+            body = self._bodies[key] = _to_json(factory(rng)).encode()
+        return body
+
+    async def _respond(self, key: str, factory: Callable[[random.Random], Any]) -> web.Response:
+        config = self.config
+        self.requests += 1
+        # Taken before awaiting, concurrent requests move the shared counter on while this one sleeps
+        number = self.requests
+        delay = config.latency + (self._rng.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if config.error_burst_every and number % config.error_burst_every < config.error_burst_length:
+            self.errors += 1
+            return web.json_response({"message": "Service Unavailable"}, status=503)
+        if config.rate_limit_probability and self._rng.random() < config.rate_limit_probability:
+            self.rate_limited += 1
+            return web.json_response(
+                {"message": "Too Many Requests"}, status=429, headers={"Retry-After": str(config.retry_after)}
+            )
+        return web.Response(body=self._body(key, factory), content_type="application/json")
+
+    async def match(self, request: web.Request) -> web.Response:
+        match_id = request.match_info["match_id"]
+        return await self._respond(f"match:{match_id}", make_match)
+
+    async def match_stats(self, request: web.Request) -> web.Response:
+        match_id = request.match_info["match_id"]
+        return await self._respond(f"stats:{match_id}", lambda rng: make_match_stats(rng, rounds=1))
+
+    async def player(self, request: web.Request) -> web.Response:
+        player_id = request.match_info["player_id"]
+        return await self._respond(f"player:{player_id}", make_player)
+
+    async def players(self, request: web.Request) -> web.Response:
+        nickname = request.query.get("nickname") or request.query.get("game_player_id", "")
+        return await self._respond(f"player:{nickname}", make_player)
+
+    async def games(self, request: web.Request) -> web.Response:
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", 20))
+        items = [{"game_id": f"game{i}", "order": i} for i in range(offset, min(offset + limit, 60))]
+        page = {"items": items, "start": offset, "end": offset + len(items)}
+        return await self._respond(f"games:{offset}:{limit}", lambda rng: page)
+
+    async def leaderboard(self, request: web.Request) -> web.Response:
+        return await self._respond(f"leaderboard:{request.match_info['leaderboard_id']}", make_leaderboard)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/matches/{match_id}", self.match)
+        app.router.add_get("/matches/{match_id}/stats", self.match_stats)
+        app.router.add_get("/players", self.players)
+        app.router.add_get("/players/{player_id}", self.player)
+        app.router.add_get("/games", self.games)
+        app.router.add_get("/leaderboards/{leaderboard_id}", self.leaderboard)
+        return app
+
+
+async def start(api: MockFaceitAPI, host: str = "127.0.0.1", port: int = 0) -> Tuple[web.AppRunner, str]:
+    """Start the server and return its runner and base URL. Port 0 picks a free port."""
+    runner = web.AppRunner(api.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://{host}:{port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
+    parser.add_argument("--error-burst-every", type=int, default=0)
+    parser.add_argument("--error-burst-length", type=int, default=0)
+    args = parser.parse_args()
+    config = MockConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_probability=args.rate_limit_probability,
+        error_burst_every=args.error_burst_every,
+        error_burst_length=args.error_burst_length,
+    )
+    web.run_app(MockFaceitAPI(config).app(), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
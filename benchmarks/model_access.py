@@ -0,0 +1,51 @@
+"""
+Measures repeated access to the nested model properties, e.g. reading every
+roster entry of a match several times, which is what analytics loops do.
+
+Run with ``python benchmarks/model_access.py``.
+"""
+
+import random
+import timeit
+
+from payloads import make_match, make_player
+
+from faceit import Match, Player
+
+
+def read_rosters(match: Match) -> int:
+    total = 0
+    for faction in match.teams.values():
+        for roster in faction.roster:
+            total += roster.game_skill_level
+        total += faction.stats.skill_level.average
+    return total
+
+
+def read_everything(match: Match) -> None:
+    read_rosters(match)
+    match.results
+    match.detailed_results
+    match.voting.map.entities
+
+
+def main() -> None:
+    rng = random.Random(0)
+    matches = [Match(data=make_match(rng)) for _ in range(1000)]
+    players = [Player(data=make_player(rng)) for _ in range(1000)]
+
+    cases = {
+        "match rosters x5": lambda: [read_rosters(match) for match in matches for _ in range(5)],
+        "match all nested x5": lambda: [read_everything(match) for match in matches for _ in range(5)],
+        "player games x5": lambda: [player.games["cs2"].faceit_elo for player in players for _ in range(5)],
+    }
+    print(f"{'case (1000 models)':<22} {'time/run':>10}")
+    for name, func in cases.items():
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f"{name:<22} {best * 1e3:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
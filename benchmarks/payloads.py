@@ -0,0 +1,239 @@
+"""
+Synthetic FACEIT API payloads for the benchmarks.
+
+The shapes follow the Data API v4 responses closely enough for decoding and
+model construction costs to be realistic. Everything is deterministic for a
+given seed.
+"""
+
+import random
+import string
+from typing import Any, Dict, List
+
+REGIONS = ("EU", "NA", "SA", "OCE", "SEA")
+MAPS = ("de_mirage", "de_inferno", "de_nuke", "de_ancient", "de_anubis", "de_vertigo", "de_dust2")
+
+
+def _id(rng: random.Random) -> str:
+    hexdigits = "0123456789abcdef"
+    parts = (8, 4, 4, 4, 12)
+    return "-".join("".join(rng.choice(hexdigits) for _ in range(n)) for n in parts)
+
+
+def _nickname(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(4, 12)))
+
+
+def make_roster(rng: random.Random) -> Dict[str, Any]:
+    player_id = _id(rng)
+    nickname = _nickname(rng)
+    return {
+        "player_id": player_id,
+        "nickname": nickname,
+        "avatar": f"https://distribution.faceit-cdn.net/images/{player_id}.jpeg",
+        "membership": rng.choice(("free", "premium")),
+        "game_player_id": str(76561197960265728 + rng.randint(0, 10**9)),
+        "game_player_name": nickname,
+        "game_skill_level": rng.randint(1, 10),
+        "anticheat_required": True,
+    }
+
+
+def make_faction(rng: random.Random, name: str) -> Dict[str, Any]:
+    roster = [make_roster(rng) for _ in range(5)]
+    return {
+        "faction_id": _id(rng),
+        "leader": roster[0]["player_id"],
+        "avatar": "https://distribution.faceit-cdn.net/images/team.jpg",
+        "roster": roster,
+        "substituted": False,
+        "name": name,
+        "type": "",
+        "stats": {
+            "winProbability": round(rng.random(), 4),
+            "skillLevel": {"average": rng.randint(1, 10), "range": {"min": 1, "max": 10}},
+            "rating": rng.randint(500, 3000),
+        },
+    }
+
+
+def make_match(rng: random.Random, status: str = "FINISHED") -> Dict[str, Any]:
+    match_id = "1-" + _id(rng)
+    started_at = 1_700_000_000 + rng.randint(0, 10**7)
+    entities = [
+        {
+            "class_name": m,
+            "game_map_id": m,
+            "guid": m,
+            "image_lg": f"https://assets.faceit-cdn.net/third_party/games/cs2/{m}.jpg",
+            "image_sm": f"https://assets.faceit-cdn.net/third_party/games/cs2/{m}_sm.jpg",
+            "name": m,
+        }
+        for m in MAPS
+    ]
+    return {
+        "match_id": match_id,
+        "version": 2,
+        "game": "cs2",
+        "region": rng.choice(REGIONS),
+        "competition_id": _id(rng),
+        "competition_type": "matchmaking",
+        "competition_name": "5v5 RANKED",
+        "organizer_id": "faceit",
+        "teams": {"faction1": make_faction(rng, "team_a"), "faction2": make_faction(rng, "team_b")},
+        "voting": {
+            "voted_entity_types": ["map"],
+            "map": {"entities": entities, "pick": [rng.choice(MAPS)]},
+            "location": {"entities": [], "pick": ["Frankfurt"]},
+        },
+        "calculate_elo": True,
+        "configured_at": started_at - 120,
+        "started_at": started_at,
+        "scheduled_at": started_at - 300,
+        "finished_at": started_at + 2400 if status == "FINISHED" else None,
+        "demo_url": [f"https://demos.faceit-cdn.net/cs2/{match_id}.dem.zst"],
+        "chat_room_id": "match-" + match_id,
+        "best_of": 1,
+        "results": {"winner": "faction1", "score": {"faction1": 1, "faction2": 0}},
+        "detailed_results": [
+            {"asc_score": True, "winner": "faction1", "factions": {"faction1": {"score": 1}, "faction2": {"score": 0}}}
+        ],
+        "status": status,
+        "faceit_url": "https://www.faceit.com/{lang}/cs2/room/" + match_id,
+    }
+
+
+def make_player_stats(rng: random.Random) -> Dict[str, str]:
+    kills = rng.randint(5, 35)
+    deaths = rng.randint(5, 30)
+    headshots = rng.randint(0, kills)
+    return {
+        "Kills": str(kills),
+        "Deaths": str(deaths),
+        "Assists": str(rng.randint(0, 12)),
+        "Headshots": str(headshots),
+        "Headshots %": str(round(100 * headshots / kills)),
+        "K/D Ratio": f"{kills / deaths:.2f}",
+        "K/R Ratio": f"{kills / 24:.2f}",
+        "ADR": f"{rng.uniform(40, 140):.1f}",
+        "Damage": str(rng.randint(800, 4000)),
+        "MVPs": str(rng.randint(0, 8)),
+        "Double Kills": str(rng.randint(0, 6)),
+        "Triple Kills": str(rng.randint(0, 3)),
+        "Quadro Kills": str(rng.randint(0, 1)),
+        "Penta Kills": str(rng.randint(0, 1)),
+        "Utility Damage": str(rng.randint(0, 400)),
+        "Enemies Flashed": str(rng.randint(0, 15)),
+        "Flash Count": str(rng.randint(0, 20)),
+        "Entry Count": str(rng.randint(0, 8)),
+        "Entry Wins": str(rng.randint(0, 6)),
+        "Clutch Kills": str(rng.randint(0, 4)),
+        "1v1Count": str(rng.randint(0, 3)),
+        "1v1Wins": str(rng.randint(0, 3)),
+        "Sniper Kills": str(rng.randint(0, 10)),
+        "Pistol Kills": str(rng.randint(0, 6)),
+        "Result": str(rng.randint(0, 1)),
+    }
+
+
+def make_match_stats(rng: random.Random, rounds: int = 1) -> Dict[str, Any]:
+    match_id = "1-" + _id(rng)
+    result: List[Dict[str, Any]] = []
+    for match_round in range(1, rounds + 1):
+        teams = []
+        for name in ("team_a", "team_b"):
+            teams.append(
+                {
+                    "team_id": _id(rng),
+                    "premade": False,
+                    "team_stats": {
+                        "Team": name,
+                        "Team Win": str(rng.randint(0, 1)),
+                        "Final Score": str(rng.randint(0, 13)),
+                        "First Half Score": str(rng.randint(0, 12)),
+                        "Second Half Score": str(rng.randint(0, 12)),
+                        "Overtime score": "0",
+                        "Team Headshots": f"{rng.uniform(2, 10):.1f}",
+                    },
+                    "players": [
+                        {"player_id": _id(rng), "nickname": _nickname(rng), "player_stats": make_player_stats(rng)}
+                        for _ in range(5)
+                    ],
+                }
+            )
+        result.append(
+            {
+                "best_of": str(rounds),
+                "competition_id": None,
+                "game_id": "cs2",
+                "game_mode": "5v5",
+                "match_id": match_id,
+                "match_round": str(match_round),
+                "played": "1",
+                "round_stats": {
+                    "Map": rng.choice(MAPS),
+                    "Rounds": "24",
+                    "Score": "13 / 11",
+                    "Winner": teams[0]["team_id"],
+                    "Region": rng.choice(REGIONS),
+                },
+                "teams": teams,
+            }
+        )
+    return {"rounds": result}
+
+
+def make_player(rng: random.Random) -> Dict[str, Any]:
+    roster = make_roster(rng)
+    return {
+        "player_id": roster["player_id"],
+        "nickname": roster["nickname"],
+        "avatar": roster["avatar"],
+        "country": rng.choice(("de", "fr", "us", "br", "pl", "se")),
+        "cover_image": "",
+        "platforms": {"steam": roster["game_player_id"]},
+        "games": {
+            "cs2": {
+                "region": rng.choice(REGIONS),
+                "game_player_id": roster["game_player_id"],
+                "skill_level": roster["game_skill_level"],
+                "faceit_elo": rng.randint(500, 3500),
+                "game_player_name": roster["nickname"],
+                "skill_level_label": "",
+                "regions": {},
+                "game_profile_id": _id(rng),
+            }
+        },
+        "settings": {"language": "en"},
+        "friends_ids": [_id(rng) for _ in range(rng.randint(0, 40))],
+        "new_steam_id": "[U:1:%d]" % rng.randint(0, 10**9),
+        "steam_id_64": roster["game_player_id"],
+        "steam_nickname": roster["nickname"],
+        "memberships": [roster["membership"]],
+        "faceit_url": "https://www.faceit.com/{lang}/players/" + roster["nickname"],
+        "membership_type": "",
+        "cover_featured_image": "",
+        "infractions": {},
+        "verified": False,
+        "activated_at": "2019-01-01T00:00:00Z",
+    }
+
+
+def make_leaderboard(rng: random.Random, size: int = 100) -> Dict[str, Any]:
+    return {
+        "items": [
+            {
+                "player": make_roster(rng),
+                "position": position,
+                "points": rng.randint(0, 5000),
+                "played": rng.randint(0, 500),
+                "won": rng.randint(0, 300),
+                "lost": rng.randint(0, 200),
+                "win_rate": round(rng.random(), 3),
+                "current_streak": rng.randint(-5, 10),
+            }
+            for position in range(1, size + 1)
+        ],
+        "start": 0,
+        "end": size,
+    }
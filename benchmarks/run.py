@@ -0,0 +1,218 @@
+"""
+Offline benchmark suite for faceit.py.
+
+Every scenario runs against the local mock server from :mod:`mock_server`, so
+no network access or API key is needed. Results are printed and can be written
+as JSON to compare runs over time. The benchmarks import the ``faceit`` package,
+so install the checkout first:
+
+    pip install -e .
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare results.json
+
+Scenarios:
+
+- ``fetch``: many concurrent ``Client.get_match`` calls with injected latency.
+- ``rate_limited``: like ``fetch``, with a share of 429 responses.
+- ``error_bursts``: like ``fetch``, with bursts of 503 responses that are retried.
+- ``models``: memory and construction time per 10k ``Match`` and ``Player`` models.
+- ``decode``: JSON decoding time of match, match stats and leaderboard payloads.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import mock_server
+from payloads import make_leaderboard, make_match, make_match_stats, make_player
+
+import faceit
+from faceit.http import Route
+from faceit.utils import HAS_ORJSON, _from_json, _to_json
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def fetch_scenario(
+    *,
+    requests: int,
+    concurrency: int,
+    config: mock_server.MockConfig,
+    retry_policy: Optional[faceit.RetryPolicy] = None,
+) -> Dict[str, Any]:
+    api = mock_server.MockFaceitAPI(config)
+    runner, base_url = await mock_server.start(api)
+    original_base = Route.BASE
+    Route.BASE = base_url
+    client = faceit.Client(retry_policy=retry_policy)
+    client.set_api_key(api_key="benchmark")
+
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(match_id: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await client.get_match(match_id)
+            except faceit.FaceitException:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch_one(f"1-{i}") for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+        await runner.cleanup()
+        Route.BASE = original_base
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1e3,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1e3,
+        "latency_mean_ms": statistics.fmean(latencies) * 1e3,
+        "errors": errors,
+        "server_requests": api.requests,
+        "server_rate_limited": api.rate_limited,
+        "server_errors": api.errors,
+    }
+
+
+def memory_per_models(
+    factory: Callable[[random.Random], Dict[str, Any]], model: type, count: int = 10_000
+) -> Dict[str, Any]:
+    rng = random.Random(0)
+    payloads = [factory(rng) for _ in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    models = [model(data=data) for data in payloads]
+    elapsed = time.perf_counter() - started
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return {
+        "models": count,
+        "construction_seconds": elapsed,
+        "allocated_bytes": allocated,
+        "payload_bytes": sum(len(_to_json(data)) for data in payloads),
+    }
+
+
+def decode_cost() -> Dict[str, Any]:
+    rng = random.Random(0)
+    payloads = {
+        "match": make_match(rng),
+        "match_stats": make_match_stats(rng, rounds=3),
+        "leaderboard": make_leaderboard(rng, size=1000),
+    }
+    results = {}
+    for name, payload in payloads.items():
+        body = _to_json(payload).encode()
+        timer = timeit.Timer(lambda: _from_json(body))
+        number, _ = timer.autorange()
+        results[name] = {
+            "bytes": len(body),
+            "decode_us": min(timer.repeat(repeat=5, number=number)) / number * 1e6,
+        }
+    return results
+
+
+async def run_all(quick: bool) -> Dict[str, Any]:
+    requests = 500 if quick else 5000
+    fast_retries = faceit.RetryPolicy(base_delay=0.01, max_delay=0.1)
+    return {
+        "fetch": await fetch_scenario(
+            requests=requests, concurrency=100, config=mock_server.MockConfig(latency=0.005, jitter=0.005)
+        ),
+        "rate_limited": await fetch_scenario(
+            requests=requests // 5,
+            concurrency=100,
+            config=mock_server.MockConfig(latency=0.005, rate_limit_probability=0.02, retry_after=0.05),
+            retry_policy=faceit.RetryPolicy(max_attempts=10),
+        ),
+        "error_bursts": await fetch_scenario(
+            requests=requests // 5,
+            concurrency=100,
+            config=mock_server.MockConfig(latency=0.005, error_burst_every=100, error_burst_length=5),
+            retry_policy=fast_retries,
+        ),
+        "models": {
+            "match": memory_per_models(make_match, faceit.Match),
+            "player": memory_per_models(make_player, faceit.Player),
+        },
+        "decode": decode_cost(),
+    }
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for faceit.py")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="compare against the results in this JSON file")
+    parser.add_argument("--quick", action="store_true", help="run fewer requests")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "faceit": faceit.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "orjson": HAS_ORJSON,
+            "timestamp": time.time(),
+            "quick": args.quick,
+        },
+        "results": asyncio.run(run_all(args.quick)),
+    }
+
+    current = flatten(report["results"])
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = flatten(json.load(fp)["results"])
+
+    for name, value in current.items():
+        line = f"{name:<45} {value:>14.3f}"
+        if name in baseline and baseline[name]:
+            line += f"  ({value / baseline[name]:.2f}x)"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
+        print(f"results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
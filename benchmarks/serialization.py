@@ -0,0 +1,67 @@
+"""
+Compares ways of shipping models to another process or an external cache:
+JSON of the payloads, pickle of the models and faceit's binary encoding.
+Every case encodes 1000 models and decodes them back into models.
+
+Run with ``python benchmarks/serialization.py``.
+"""
+
+import json
+import pickle
+import random
+import timeit
+
+from payloads import make_match, make_player
+
+from faceit import Match, Player, decode_models, encode_models
+from faceit.serialization import HAS_MSGPACK
+from faceit.utils import HAS_ORJSON, _from_json, _to_json
+
+
+def cases(model, models):
+    return {
+        "json": (
+            lambda: json.dumps([item.to_dict() for item in models]).encode(),
+            lambda data: [model(data=payload) for payload in json.loads(data)],
+        ),
+        "faceit json": (
+            lambda: _to_json([item.to_dict() for item in models]).encode(),
+            lambda data: [model(data=payload) for payload in _from_json(data)],
+        ),
+        "pickle": (
+            lambda: pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        "encode_models": (
+            lambda: encode_models(models),
+            decode_models,
+        ),
+    }
+
+
+def best(func) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    rng = random.Random(0)
+    samples = {
+        "Match": (Match, [Match(data=make_match(rng)) for _ in range(1000)]),
+        "Player": (Player, [Player(data=make_player(rng)) for _ in range(1000)]),
+    }
+    print(f"orjson: {HAS_ORJSON}, msgpack: {HAS_MSGPACK}")
+    print(f"{'case (1000 models)':<24} {'encode':>9} {'decode':>9} {'size':>10}")
+    for name, (model, models) in samples.items():
+        for case, (encode, decode) in cases(model, models).items():
+            data = encode()
+            assert [item.__getstate__() for item in decode(data)] == [item.__getstate__() for item in models]
+            print(
+                f"{name + ' ' + case:<24} {best(encode) * 1e3:>7.2f}ms {best(lambda: decode(data)) * 1e3:>7.2f}ms "
+                f"{len(data) / 1024:>8.0f}KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
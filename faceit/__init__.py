@@ -17,12 +17,30 @@ __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 import logging
 from typing import NamedTuple
 
+from .bulk import *
+from .cache import *
 from .client import *
+from .crawler import *
 from .errors import *
+from .events import *
+from .export import *
+from .frame import *
 from .game import *
+from .history import *
+from .identity import *
+from .keys import *
 from .match import *
+from .metrics import *
 from .organizer import *
+from .pagination import *
 from .player import *
+from .ratelimit import *
+from .retry import *
+from .serialization import *
+from .stats import *
+from .transport import *
+from .watch import *
+from .webhook import *
 
 
 class VersionInfo(NamedTuple):
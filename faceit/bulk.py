@@ -0,0 +1,122 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterable, Optional, Set, TypeVar
+
+import aiohttp
+
+from .errors import CircuitBreakerOpen, HTTPException
+
+__all__ = ("BulkResult",)
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+class BulkResult(Generic[K, T]):
+    """The outcome of a single item of a bulk request.
+
+    Exactly one of :attr:`result` and :attr:`error` is set.
+    """
+
+    __slots__ = (
+        "_key",
+        "_result",
+        "_error",
+    )
+
+    def __init__(self, key: K, *, result: Optional[T] = None, error: Optional[Exception] = None) -> None:
+        self._key = key
+        self._result = result
+        self._error = error
+
+    def __repr__(self) -> str:
+        return f"BulkResult(key={self._key!r}, result={self._result!r}, error={self._error!r})"
+
+    @property
+    def key(self) -> K:
+        """The ID that was requested."""
+        return self._key
+
+    @property
+    def result(self) -> Optional[T]:
+        return self._result
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """The exception the request failed with, e.g. :exc:`NotFound`, :exc:`CircuitBreakerOpen`
+        or a connection error.
+        """
+        return self._error
+
+    @property
+    def ok(self) -> bool:
+        return self._error is None
+
+
+async def bulk_fetch(
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    *,
+    concurrency: int,
+) -> AsyncIterator[BulkResult[K, T]]:
+    """Call ``fetch`` for every key with at most ``concurrency`` calls in flight.
+
+    Results are yielded in completion order. A new call is only started once a
+    slot frees up, so a slow consumer also slows down the fetching.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def run(key: K) -> BulkResult[K, T]:
+        try:
+            result = await fetch(key)
+        except (HTTPException, CircuitBreakerOpen, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            return BulkResult(key, error=exc)
+        return BulkResult(key, result=result)
+
+    iterator = iter(keys)
+    pending: Set[asyncio.Task[BulkResult[K, T]]] = set()
+
+    def fill() -> None:
+        while len(pending) < concurrency:
+            try:
+                key = next(iterator)
+            except StopIteration:
+                return
+            pending.add(asyncio.create_task(run(key)))
+
+    fill()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            fill()
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,357 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Union
+
+from .utils import _from_json, _to_json
+
+__all__ = (
+    "FOREVER",
+    "CacheStats",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "CachePolicy",
+)
+
+
+_log = logging.getLogger(__name__)
+
+FOREVER: float = math.inf
+"""A TTL for payloads that never change."""
+
+TTL = Union[float, Callable[[Any], float]]
+
+
+def _estimate_size(value: Any) -> int:
+    return len(_to_json(value))
+
+
+class CacheStats:
+    """Counters of a :class:`CacheBackend`, meant for sizing the cache."""
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+    )
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations})"
+        )
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend:
+    """The interface :class:`HTTPClient` uses to cache decoded responses.
+
+    Keys are built from the method, URL and query parameters of a request. Values
+    are the decoded JSON payloads and must be treated as read-only, since the same
+    object is handed to every caller.
+    """
+
+    def __init__(self) -> None:
+        self.stats: CacheStats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload for ``key`` or ``None`` if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, *, ttl: float, size: Optional[int] = None) -> None:
+        """Store ``value`` for ``ttl`` seconds. ``size`` is the payload size in bytes, if known."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+class MemoryCache(CacheBackend):
+    """An in-memory LRU cache bounded by entry count and total payload size.
+
+    Parameters
+    ----------
+    max_entries: :class:`int`
+        The maximum number of payloads to keep. Defaults to 10000.
+    max_bytes: Optional[:class:`int`]
+        The maximum total size of the payloads in bytes. Responses are measured by their
+        raw body as passed by the :class:`HTTPClient`, other values as compact JSON.
+        ``None`` means no limit. Defaults to 64 MiB.
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, max_bytes: Optional[int] = 64 * 1024 * 1024) -> None:
+        super().__init__()
+        self.max_entries: int = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.total_bytes: int = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"MemoryCache(entries={len(self._entries)}, total_bytes={self.total_bytes}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, *, ttl: float, size: Optional[int] = None) -> None:
+        if ttl <= 0:
+            return
+        if size is None:
+            size = _estimate_size(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            _log.debug(f"Not caching {key}, {size} bytes is larger than the whole cache")
+            return
+
+        self._remove(key)
+        self._entries[key] = _Entry(value, time.monotonic() + ttl, size)
+        self.total_bytes += size
+
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.total_bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+            self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+
+class SQLiteCache(CacheBackend):
+    """A persistent LRU cache stored in a SQLite database.
+
+    Payloads survive restarts, so a new :class:`Client` can serve finished matches
+    and match statistics it has seen before without touching the network. Pair it
+    with a policy that only caches immutable payloads, e.g.
+    ``CachePolicy({"/matches/{match_id}": ..., "/matches/{match_id}/stats": FOREVER})``.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The database file. It is created if it does not exist.
+    max_bytes: Optional[:class:`int`]
+        The maximum total size of the stored JSON in bytes, measured on the JSON that
+        is written, so the ``size`` passed to :meth:`set` is not used. The least
+        recently used payloads are evicted once it is exceeded. ``None`` means no limit.
+        Defaults to 1 GiB.
+    """
+
+    # Last access times are only written back with this granularity, so hits stay read-only
+    ACCESS_RESOLUTION = 60.0
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, max_bytes: Optional[int] = 1024 * 1024 * 1024) -> None:
+        super().__init__()
+        self.path: str = os.fspath(path)
+        self.max_bytes: Optional[int] = max_bytes
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.total_bytes: int = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"SQLiteCache(path={self.path!r}, total_bytes={self.total_bytes}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._db.execute("SELECT value, expires_at, accessed_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            self.delete(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        if now - accessed_at > self.ACCESS_RESOLUTION:
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return _from_json(value)
+
+    def set(self, key: str, value: Any, *, ttl: float, size: Optional[int] = None) -> None:
+        if ttl <= 0:
+            return
+        raw = _to_json(value)
+        size = len(raw)
+        if self.max_bytes is not None and size > self.max_bytes:
+            _log.debug(f"Not caching {key}, {size} bytes is larger than the whole cache")
+            return
+
+        now = time.time()
+        expires_at = None if ttl == FOREVER else now + ttl
+        with self._db:
+            self._db.execute("BEGIN")
+            self.total_bytes -= self._size_of(key)
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, raw, expires_at, size, now),
+            )
+            self.total_bytes += size
+            if self.max_bytes is not None and self.total_bytes > self.max_bytes:
+                self._evict(self.max_bytes)
+
+    def delete(self, key: str) -> None:
+        with self._db:
+            self._db.execute("BEGIN")
+            self.total_bytes -= self._size_of(key)
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM responses")
+        self.total_bytes = 0
+
+    def compact(self) -> None:
+        """Drop expired payloads and give the freed space back to the file system."""
+        cursor = self._db.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        self.stats.expirations += max(cursor.rowcount, 0)
+        self.total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._db.execute("VACUUM")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _size_of(self, key: str) -> int:
+        row = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def _evict(self, max_bytes: int) -> None:
+        cursor = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for key, size in cursor:
+            if self.total_bytes <= max_bytes:
+                break
+            evicted.append((key,))
+            self.total_bytes -= size
+        cursor.close()
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
+
+
+def _match_ttl(data: Any) -> float:
+    status = data.get("status") if isinstance(data, dict) else None
+    if status in CachePolicy.FINAL_MATCH_STATUSES:
+        return FOREVER
+    if status == "ONGOING":
+        return 5.0
+    return 30.0
+
+
+class CachePolicy:
+    """Decides how long a response may be cached.
+
+    Parameters
+    ----------
+    rules: Optional[Mapping[:class:`str`, Union[:class:`float`, Callable[[Any], :class:`float`]]]]
+        A TTL in seconds per route template, e.g. ``{"/games": 3600}``. Instead of a
+        number a rule can be a callable that receives the decoded payload and returns
+        the TTL, which allows caching by content. Use :data:`FOREVER` for payloads
+        that never change.
+    default: :class:`float`
+        The TTL of routes without a rule. Defaults to 0, i.e. they are not cached.
+    """
+
+    FINAL_MATCH_STATUSES = frozenset({"FINISHED", "CANCELLED"})
+
+    def __init__(self, rules: Optional[Mapping[str, TTL]] = None, *, default: float = 0.0) -> None:
+        self.rules: Dict[str, TTL] = dict(rules or {})
+        self.default: float = default
+
+    def __repr__(self) -> str:
+        return f"CachePolicy(rules={self.rules!r}, default={self.default})"
+
+    @classmethod
+    def recommended(cls) -> "CachePolicy":
+        """A policy that caches matches forever once they are finished or cancelled,
+        live matches for a few seconds, match statistics forever and games for a day.
+        """
+        return cls(
+            {
+                "/matches/{match_id}": _match_ttl,
+                "/matches/{match_id}/stats": FOREVER,
+                "/games": 86400.0,
+                "/games/{game_id}": 86400.0,
+            }
+        )
+
+    def ttl_for(self, path: str, data: Any) -> float:
+        """Return the TTL in seconds for ``data`` received from the route template ``path``."""
+        rule = self.rules.get(path, self.default)
+        if callable(rule):
+            return rule(data)
+        return rule
@@ -22,35 +22,105 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import functools
 import logging
-from typing import List
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
+from .bulk import BulkResult, bulk_fetch
+from .cache import CacheBackend, CachePolicy
+from .events import MatchEventStream
 from .game import Game
 from .http import HTTPClient
-from .match import Match
+from .identity import IdentityMap
+from .keys import APIKeyPool
+from .match import Match, MatchHistoryItem
+from .metrics import Metrics
 from .organizer import Organizer
+from .pagination import Paginator
 from .player import Player
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .stats import MatchStats
+from .transport import Transport
+from .watch import MatchWatcher
 
 __all__ = ("Client",)
 
 
 _log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _history_params(game: str, since: Optional[int], until: Optional[int]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"game": game}
+    if since is not None:
+        params["from"] = since
+    if until is not None:
+        params["to"] = until
+    return params
+
 
 class Client:
-    def __init__(self, debug: bool = False):
-        self.http: HTTPClient = HTTPClient()
+    def __init__(
+        self,
+        debug: bool = False,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        transport: Optional[Transport] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        identity_map: Optional[IdentityMap] = None,
+        raw: bool = False,
+    ):
+        self.raw: bool = raw
+        self.identity_map: Optional[IdentityMap] = identity_map
+        self.http: HTTPClient = HTTPClient(
+            rate_limiter=rate_limiter,
+            cache=cache,
+            cache_policy=cache_policy,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            metrics=metrics,
+            transport=transport,
+            key_pool=key_pool,
+        )
 
     def set_api_key(self, *, api_key: str):
         self.http.set_api_key(api_key)
 
+    def _wrap(self, model: Callable[..., T], data: Dict[str, Any], raw: Optional[bool]) -> Union[T, Dict[str, Any]]:
+        # In raw mode the payload is handed out as-is, it can still be wrapped later with e.g. Match(data=payload).
+        # It may be shared with other callers through the cache and request coalescing, so it must not be mutated.
+        if self.raw if raw is None else raw:
+            return data
+        metrics = self.http.metrics
+        if metrics is None:
+            return self._build(model, data)
+        started = time.perf_counter()
+        result = self._build(model, data)
+        metrics.observe("model_seconds", model.__name__, time.perf_counter() - started)
+        return result
+
+    def _build(self, model: Callable[..., T], data: Dict[str, Any]) -> T:
+        if self.identity_map is not None:
+            return self.identity_map.build(model, data)
+        return model(data=data)
+
     async def close(self) -> None:
         """*coroutine*
         Closes the `aiohttp.ClientSession`.
         """
         await self.http.close()
 
-    async def get_games(self, *, offset: int = 0, limit: int = 20) -> List[Game]:
+    async def get_games(
+        self, *, offset: int = 0, limit: int = 20, raw: Optional[bool] = None
+    ) -> List[Union[Game, Dict[str, Any]]]:
         """*coroutine*
         Return a list of all available games.
 
@@ -60,6 +130,9 @@ class Client:
             The starting item position. Defaults to 0.
         limit: :class:`int`
             The number of items to return. Defaults to 20.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Game`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
@@ -70,9 +143,50 @@ class Client:
             "limit": limit
         }
         data = await self.http.get_games(params=params)
-        return [Game(data=game_data) for game_data in data["items"]]
+        return [self._wrap(Game, game_data, raw) for game_data in data["items"]]
+
+    def iter_games(
+        self, *, offset: int = 0, limit: int = 20, prefetch: int = 1, ordered: bool = True, raw: Optional[bool] = None
+    ) -> Paginator[Union[Game, Dict[str, Any]]]:
+        """Return an asynchronous iterator over all available games.
+
+        Unlike :meth:`get_games` this walks every page, fetching the next ``prefetch``
+        pages while the current one is consumed.
+
+        .. code-block:: python3
+
+            async for game in client.iter_games():
+                print(game.long_label)
 
-    async def get_player_by_nickname(self, nickname: str) -> Player:
+        Parameters
+        ----------
+        offset: :class:`int`
+            The starting item position. Defaults to 0.
+        limit: :class:`int`
+            The number of items per page. Defaults to 20.
+        prefetch: :class:`int`
+            The number of pages fetched ahead, i.e. in parallel. Defaults to 1.
+        ordered: :class:`bool`
+            Whether games are yielded in offset order or page by page as they arrive.
+            Defaults to ``True``.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Game`. Defaults to the
+            ``raw`` setting of the client.
+
+        Yields
+        ------
+        :class:`Game`
+        """
+        return Paginator(
+            lambda params: self.http.get_games(params=params),
+            lambda data: self._wrap(Game, data, raw),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+            ordered=ordered,
+        )
+
+    async def get_player_by_nickname(self, nickname: str, *, raw: Optional[bool] = None) -> Union[Player, Dict[str, Any]]:
         """*coroutine*
         Return a player.
 
@@ -80,6 +194,9 @@ class Client:
         ----------
         nickname: :class:`str`
             The nickname of the player.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Player`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
@@ -89,9 +206,11 @@ class Client:
             "nickname": nickname,
         }
         data = await self.http.get_players(params=params)
-        return Player(data=data)
+        return self._wrap(Player, data, raw)
     
-    async def get_player_by_game_and_game_player_id(self, game: str, game_player_id: str) -> Player:
+    async def get_player_by_game_and_game_player_id(
+        self, game: str, game_player_id: str, *, raw: Optional[bool] = None
+    ) -> Union[Player, Dict[str, Any]]:
         """*coroutine*
         Return a player.
 
@@ -101,6 +220,9 @@ class Client:
             The game of the corresponding player ID.
         game_player_id: :class:`str`
             The ID for the player, e.g. SteamID64 for Valve games like Team Fortress 2 or Counter-Strike 2.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Player`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
@@ -111,9 +233,9 @@ class Client:
             "game_player_id": game_player_id,
         }
         data = await self.http.get_players(params=params)
-        return Player(data=data)
+        return self._wrap(Player, data, raw)
 
-    async def get_player_by_id(self, player_id: str) -> Player:
+    async def get_player_by_id(self, player_id: str, *, raw: Optional[bool] = None) -> Union[Player, Dict[str, Any]]:
         """*coroutine*
         Return a specific player.
 
@@ -121,15 +243,117 @@ class Client:
         ----------
         player_id: :class:`str`
             The ID of the player.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Player`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
         :class:`Player`
         """
         data = await self.http.get_player(player_id=player_id)
-        return Player(data=data)
+        return self._wrap(Player, data, raw)
+
+    def get_players(
+        self, player_ids: Iterable[str], *, concurrency: int = 10, raw: Optional[bool] = None
+    ) -> AsyncIterator[BulkResult[str, Union[Player, Dict[str, Any]]]]:
+        """Return an asynchronous iterator over many players.
+
+        Players are fetched with at most ``concurrency`` requests in flight and are
+        yielded as soon as they arrive, not in the order of ``player_ids``. A failed
+        request does not stop the iteration, it is reported on its :class:`BulkResult`.
+
+        Parameters
+        ----------
+        player_ids: Iterable[:class:`str`]
+            The IDs of the players.
+        concurrency: :class:`int`
+            The maximum number of requests in flight. Defaults to 10.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Player`. Defaults to the
+            ``raw`` setting of the client.
+
+        Yields
+        ------
+        :class:`BulkResult`
+            The player ID as :attr:`BulkResult.key` and either the :class:`Player`
+            or the exception, e.g. :exc:`NotFound`, that was raised for it.
+        """
+        fetch = functools.partial(self.get_player_by_id, raw=raw)
+        return bulk_fetch(player_ids, fetch, concurrency=concurrency)
+
+    async def get_player_history(
+        self,
+        player_id: str,
+        game: str,
+        *,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 20,
+        raw: Optional[bool] = None,
+    ) -> List[Union[MatchHistoryItem, Dict[str, Any]]]:
+        """*coroutine*
+        Return the matches a player played in a game, the most recent first.
+
+        Parameters
+        ----------
+        player_id: :class:`str`
+            The ID of the player.
+        game: :class:`str`
+            The ID of the game, e.g. ``cs2``.
+        since: Optional[:class:`int`]
+            Only return matches since this Unix timestamp. The API defaults to one month ago,
+            pass 0 for the whole history.
+        until: Optional[:class:`int`]
+            Only return matches until this Unix timestamp. Defaults to now.
+        offset: :class:`int`
+            The starting item position. Defaults to 0.
+        limit: :class:`int`
+            The number of items to return, at most 100. Defaults to 20.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payloads instead of :class:`MatchHistoryItem`. Defaults to the
+            ``raw`` setting of the client.
+
+        Returns
+        -------
+        List[:class:`MatchHistoryItem`]
+        """
+        params = _history_params(game, since, until)
+        params.update(offset=offset, limit=limit)
+        data = await self.http.get_player_history(player_id, params=params)
+        return [self._wrap(MatchHistoryItem, item, raw) for item in data["items"]]
+
+    def iter_player_history(
+        self,
+        player_id: str,
+        game: str,
+        *,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: int = 100,
+        prefetch: int = 1,
+        raw: Optional[bool] = None,
+    ) -> Paginator[Union[MatchHistoryItem, Dict[str, Any]]]:
+        """Return an asynchronous iterator over the matches a player played in a game,
+        the most recent first.
+
+        See :meth:`get_player_history` for the parameters. ``limit`` is the number of
+        items per page and ``prefetch`` the number of pages fetched ahead.
 
-    async def get_organizer_by_name(self, name: str) -> Organizer:
+        Yields
+        ------
+        :class:`MatchHistoryItem`
+        """
+        return Paginator(
+            lambda params: self.http.get_player_history(player_id, params=params),
+            lambda data: self._wrap(MatchHistoryItem, data, raw),
+            limit=limit,
+            prefetch=prefetch,
+            params=_history_params(game, since, until),
+        )
+
+    async def get_organizer_by_name(self, name: str, *, raw: Optional[bool] = None) -> Union[Organizer, Dict[str, Any]]:
         """*coroutine*
         Return an organization by their name.
 
@@ -137,6 +361,9 @@ class Client:
         ----------
         name: :class:`str`
             The name of the organization.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Organizer`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
@@ -146,9 +373,9 @@ class Client:
             "name": name,
         }
         data = await self.http.get_organizer_by_name(params=params)
-        return Organizer(data=data)
+        return self._wrap(Organizer, data, raw)
 
-    async def get_match(self, match_id: str) -> Match:
+    async def get_match(self, match_id: str, *, raw: Optional[bool] = None) -> Union[Match, Dict[str, Any]]:
         """*coroutine*
         Return a specific match.
 
@@ -156,10 +383,90 @@ class Client:
         ----------
         match_id: :class:`str`
             The ID of the match.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Match`. Defaults to the
+            ``raw`` setting of the client.
 
         Returns
         -------
         :class:`Match`
         """
         data = await self.http.get_match(match_id)
-        return Match(data=data)
+        return self._wrap(Match, data, raw)
+
+    def match_events(self, match_ids: Iterable[str], **options: Any) -> MatchEventStream:
+        """Return an asynchronous iterator over the changes of matches while they are live.
+
+        The matches are polled by a :class:`MatchWatcher` that adapts to their state,
+        and only changes are yielded: :class:`StatusChanged`, :class:`ScoreChanged`,
+        :class:`MapDecided` and :class:`RosterSubstituted`. The first poll of every
+        match yields a :class:`StatusChanged` from ``None``. Iteration ends once every
+        match is over; more matches can be added through :attr:`MatchEventStream.watcher`.
+
+        .. code-block:: python3
+
+            async for event in client.match_events(match_ids):
+                if isinstance(event, faceit.ScoreChanged):
+                    print(event.match_id, event.after)
+
+        Parameters
+        ----------
+        match_ids: Iterable[:class:`str`]
+            The IDs of the matches.
+        **options: Any
+            Passed on to :class:`MatchWatcher`, e.g. ``concurrency`` or ``ongoing_interval``.
+
+        Returns
+        -------
+        :class:`MatchEventStream`
+        """
+        watcher = MatchWatcher(self, raw=True, **options)
+        watcher.watch_many(match_ids)
+        return MatchEventStream(watcher)
+
+    async def get_match_stats(self, match_id: str, *, raw: Optional[bool] = None) -> Union[MatchStats, Dict[str, Any]]:
+        """*coroutine*
+        Return the statistics of a specific match.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The ID of the match.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`MatchStats`. Defaults to the
+            ``raw`` setting of the client.
+
+        Returns
+        -------
+        :class:`MatchStats`
+        """
+        data = await self.http.get_match_stats(match_id)
+        return self._wrap(MatchStats, data, raw)
+
+    def get_matches(
+        self, match_ids: Iterable[str], *, concurrency: int = 10, raw: Optional[bool] = None
+    ) -> AsyncIterator[BulkResult[str, Union[Match, Dict[str, Any]]]]:
+        """Return an asynchronous iterator over many matches.
+
+        Matches are fetched with at most ``concurrency`` requests in flight and are
+        yielded as soon as they arrive, not in the order of ``match_ids``. A failed
+        request does not stop the iteration, it is reported on its :class:`BulkResult`.
+
+        Parameters
+        ----------
+        match_ids: Iterable[:class:`str`]
+            The IDs of the matches.
+        concurrency: :class:`int`
+            The maximum number of requests in flight. Defaults to 10.
+        raw: Optional[:class:`bool`]
+            Return the decoded JSON payload instead of a :class:`Match`. Defaults to the
+            ``raw`` setting of the client.
+
+        Yields
+        ------
+        :class:`BulkResult`
+            The match ID as :attr:`BulkResult.key` and either the :class:`Match`
+            or the exception, e.g. :exc:`NotFound`, that was raised for it.
+        """
+        fetch = functools.partial(self.get_match, raw=raw)
+        return bulk_fetch(match_ids, fetch, concurrency=concurrency)
@@ -0,0 +1,242 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bulk import BulkResult, bulk_fetch
+from .errors import FaceitException
+from .ratelimit import SharedRateLimiter
+
+__all__ = ("Crawler",)
+
+
+_log = logging.getLogger(__name__)
+
+# What can be crawled and the Client method that fetches a single item of it
+_FETCHERS = {
+    "matches": "get_match",
+    "match_stats": "get_match_stats",
+    "players": "get_player_by_id",
+}
+
+_Batch = List[Tuple[str, Any, Optional[Exception]]]
+
+
+def _portable(exc: Exception) -> Exception:
+    # Anything that doesn't come back out of pickle intact would kill the parent's results.get()
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return FaceitException(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+async def _crawl_shard(
+    api_key: str,
+    kind: str,
+    ids: List[str],
+    options: Dict[str, Any],
+    transform: Optional[Callable[[Any], Any]],
+    concurrency: int,
+    batch_size: int,
+    results: "multiprocessing.Queue[Optional[_Batch]]",
+) -> None:
+    from .client import Client
+
+    client = Client(**options)
+    client.set_api_key(api_key=api_key)
+    batch: _Batch = []
+    try:
+        async for result in bulk_fetch(ids, getattr(client, _FETCHERS[kind]), concurrency=concurrency):
+            if result.ok:
+                value = transform(result.result) if transform is not None else result.result
+                batch.append((result.key, value, None))
+            else:
+                batch.append((result.key, None, _portable(result.error)))  # type: ignore
+            # Results are sent in batches, one pickle and pipe write per batch instead of per item
+            if len(batch) >= batch_size:
+                results.put(batch)
+                batch = []
+        if batch:
+            results.put(batch)
+    finally:
+        await client.close()
+
+
+def _run_worker(*args: Any) -> None:
+    results = args[-1]
+    try:
+        asyncio.run(_crawl_shard(*args))
+    finally:
+        # Tells the parent that this shard is done
+        results.put(None)
+
+
+class Crawler:
+    """Fetches large numbers of items with several worker processes.
+
+    Decoding JSON and building models is CPU bound, so a single process runs
+    out of CPU long before it runs out of API quota. The crawler splits the IDs
+    into one shard per process. Each worker runs its own :class:`Client`, and
+    all of them draw from a single :class:`SharedRateLimiter`, so together they
+    stay within ``global_limit``. Results are sent back to the calling process
+    in pickled batches.
+
+    Since the workers are started with the ``spawn`` method, scripts using the
+    crawler must guard their entry point with ``if __name__ == "__main__":``.
+
+    Parameters
+    ----------
+    api_key: :class:`str`
+        The API key used by every worker.
+    processes: Optional[:class:`int`]
+        The number of worker processes. Defaults to the number of CPUs.
+    global_limit: Optional[Tuple[:class:`int`, :class:`float`]]
+        ``(rate, per)`` shared by all workers. ``None`` disables the shared limit.
+    concurrency: :class:`int`
+        The maximum number of requests in flight per worker. Defaults to 10.
+    transform: Optional[Callable[[Any], Any]]
+        Applied to every item in the worker before it is sent back, e.g. to pick the
+        few fields that are needed. Must be picklable, i.e. a module-level function.
+    raw: :class:`bool`
+        Whether the workers fetch the decoded JSON payloads instead of models. Defaults
+        to ``True``, which avoids building models that are only pickled again.
+    batch_size: :class:`int`
+        The number of results sent back at once. Defaults to 64.
+    **options: Any
+        Passed on to the :class:`Client` of every worker, e.g. ``retry_policy``. They
+        must be picklable.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        processes: Optional[int] = None,
+        global_limit: Optional[Tuple[int, float]] = None,
+        concurrency: int = 10,
+        transform: Optional[Callable[[Any], Any]] = None,
+        raw: bool = True,
+        batch_size: int = 64,
+        **options: Any,
+    ) -> None:
+        self.api_key: str = api_key
+        self.processes: int = processes or os.cpu_count() or 1
+        self.concurrency: int = concurrency
+        self.transform: Optional[Callable[[Any], Any]] = transform
+        self.batch_size: int = batch_size
+        self._context = multiprocessing.get_context("spawn")
+        self.rate_limiter: SharedRateLimiter = SharedRateLimiter(global_limit=global_limit, context=self._context)
+        self.options: Dict[str, Any] = dict(options, raw=raw, rate_limiter=self.rate_limiter)
+
+    def __repr__(self) -> str:
+        return f"<Crawler processes={self.processes} concurrency={self.concurrency}>"
+
+    def crawl(self, kind: str, ids: Iterable[str]) -> Iterator[BulkResult[str, Any]]:
+        """Fetch every item and yield the results as they arrive.
+
+        Blocks while waiting for the workers; call it from a thread when running
+        inside an event loop.
+
+        Parameters
+        ----------
+        kind: :class:`str`
+            What to fetch, one of ``matches``, ``match_stats`` or ``players``.
+        ids: Iterable[:class:`str`]
+            The IDs of the items.
+
+        Yields
+        ------
+        :class:`BulkResult`
+            The ID and either the (transformed) item or the error. Library errors such as
+            :exc:`NotFound` arrive unchanged, only errors that can't be pickled and
+            unpickled arrive as a :exc:`FaceitException` carrying their message.
+
+        Raises
+        ------
+        ValueError
+            ``kind`` is not supported.
+        RuntimeError
+            A worker process died.
+        """
+        if kind not in _FETCHERS:
+            raise ValueError(f"kind must be one of {', '.join(_FETCHERS)}, not {kind!r}")
+
+        ids = list(ids)
+        shards = [ids[index :: self.processes] for index in range(self.processes)]
+        results = self._context.Queue()
+        workers = [
+            self._context.Process(
+                target=_run_worker,
+                args=(
+                    self.api_key,
+                    kind,
+                    shard,
+                    self.options,
+                    self.transform,
+                    self.concurrency,
+                    self.batch_size,
+                    results,
+                ),
+                daemon=True,
+            )
+            for shard in shards
+            if shard
+        ]
+        for worker in workers:
+            worker.start()
+        _log.debug(f"Crawling {len(ids)} {kind} with {len(workers)} processes")
+
+        running = len(workers)
+        try:
+            while running:
+                try:
+                    batch = results.get(timeout=1.0)
+                except queue.Empty:
+                    # A worker that was killed never sends its end marker
+                    for worker in workers:
+                        if worker.exitcode not in (None, 0):
+                            raise RuntimeError(f"Crawler worker {worker.pid} exited with {worker.exitcode}")
+                    continue
+                if batch is None:
+                    running -= 1
+                    continue
+                for key, result, error in batch:
+                    yield BulkResult(key, result=result, error=error)
+            for worker in workers:
+                worker.join()
+                if worker.exitcode:
+                    raise RuntimeError(f"Crawler worker {worker.pid} exited with {worker.exitcode}")
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            results.close()
@@ -30,6 +30,7 @@ __all__ = (
     "Forbidden",
     "NotFound",
     "ServiceUnavailable",
+    "CircuitBreakerOpen",
 )
 
 
@@ -46,10 +47,9 @@ class HTTPException(FaceitException):
     """Exception that's raised when an HTTP request operation fails.
     Attributes
     ------------
-    response: :class:`aiohttp.ClientResponse`
-        The response of the failed HTTP request. This is an
-        instance of :class:`aiohttp.ClientResponse`. In some cases
-        this could also be a :class:`requests.Response`.
+    response: :class:`TransportResponse`
+        The response of the failed HTTP request, including its
+        headers and raw body.
     text: :class:`str`
         The text of the error. Could be an empty string.
     status: :class:`int`
@@ -58,6 +58,7 @@ class HTTPException(FaceitException):
 
     def __init__(self, response, message):
         self.response = response
+        self._message = message
         self.status = response.status
         if isinstance(message, dict):
             base = message.get("message", "")
@@ -77,6 +78,9 @@ class HTTPException(FaceitException):
 
         super().__init__(fmt.format(self.response, self.text))
 
+    def __reduce__(self):
+        return (type(self), (self.response, self._message))
+
 
 class BadRequest(HTTPException):
     """Exception that's raised for when status code 400 occurs.
@@ -116,3 +120,21 @@ class ServiceUnavailable(HTTPException):
     Subclass of :exc:`HTTPException`"""
 
     pass
+
+
+class CircuitBreakerOpen(FaceitException):
+    """Exception that's raised when a request is refused without being sent
+    because the API failed too often in a row.
+
+    Attributes
+    ------------
+    retry_after: :class:`float`
+        The number of seconds until the next request is let through to probe the API.
+    """
+
+    def __init__(self, retry_after: float):
+        self.retry_after: float = retry_after
+        super().__init__(f"The FACEIT API is failing, requests are refused for {retry_after:.1f} more seconds")
+
+    def __reduce__(self):
+        return (type(self), (self.retry_after,))
@@ -0,0 +1,259 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .watch import MatchWatcher
+
+__all__ = (
+    "MatchEvent",
+    "StatusChanged",
+    "ScoreChanged",
+    "MapDecided",
+    "RosterSubstituted",
+    "diff_match",
+    "MatchEventStream",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class MatchEvent:
+    """Base class of the changes :func:`diff_match` detects.
+
+    Attributes
+    ----------
+    match_id: :class:`str`
+        The ID of the match that changed.
+    """
+
+    __slots__ = ("match_id",)
+
+    def __init__(self, match_id: str) -> None:
+        self.match_id: str = match_id
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields())
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self._fields())
+
+    def _fields(self) -> List[str]:
+        return [name for cls in reversed(type(self).__mro__) for name in getattr(cls, "__slots__", ())]
+
+
+class StatusChanged(MatchEvent):
+    """The status of a match changed, e.g. from ``READY`` to ``ONGOING``.
+
+    Attributes
+    ----------
+    before: Optional[:class:`str`]
+        The previous status, ``None`` the first time a match is seen.
+    after: :class:`str`
+        The new status.
+    """
+
+    __slots__ = (
+        "before",
+        "after",
+    )
+
+    def __init__(self, match_id: str, before: Optional[str], after: str) -> None:
+        super().__init__(match_id)
+        self.before: Optional[str] = before
+        self.after: str = after
+
+
+class ScoreChanged(MatchEvent):
+    """The score in ``results`` changed.
+
+    Attributes
+    ----------
+    before: Optional[Dict[:class:`str`, :class:`int`]]
+        The previous score by faction.
+    after: Optional[Dict[:class:`str`, :class:`int`]]
+        The new score by faction.
+    winner: Optional[:class:`str`]
+        The winning faction, once there is one.
+    """
+
+    __slots__ = (
+        "before",
+        "after",
+        "winner",
+    )
+
+    def __init__(
+        self,
+        match_id: str,
+        before: Optional[Dict[str, int]],
+        after: Optional[Dict[str, int]],
+        winner: Optional[str] = None,
+    ) -> None:
+        super().__init__(match_id)
+        self.before: Optional[Dict[str, int]] = before
+        self.after: Optional[Dict[str, int]] = after
+        self.winner: Optional[str] = winner
+
+
+class MapDecided(MatchEvent):
+    """The map vote picked the maps of the match.
+
+    Attributes
+    ----------
+    maps: List[:class:`str`]
+        The picked maps in the order they are played.
+    """
+
+    __slots__ = ("maps",)
+
+    def __init__(self, match_id: str, maps: List[str]) -> None:
+        super().__init__(match_id)
+        self.maps: List[str] = maps
+
+
+class RosterSubstituted(MatchEvent):
+    """Players were substituted in a faction.
+
+    Attributes
+    ----------
+    faction: :class:`str`
+        The key of the faction in ``teams``, e.g. ``faction1``.
+    joined: List[:class:`str`]
+        The IDs of the players that joined the roster.
+    left: List[:class:`str`]
+        The IDs of the players that left the roster.
+    """
+
+    __slots__ = (
+        "faction",
+        "joined",
+        "left",
+    )
+
+    def __init__(self, match_id: str, faction: str, joined: List[str], left: List[str]) -> None:
+        super().__init__(match_id)
+        self.faction: str = faction
+        self.joined: List[str] = joined
+        self.left: List[str] = left
+
+
+def _roster_ids(faction: Dict[str, Any]) -> List[str]:
+    return [player.get("player_id") for player in faction.get("roster") or ()]
+
+
+def diff_match(before: Optional[Dict[str, Any]], after: Dict[str, Any]) -> List[MatchEvent]:
+    """Return the changes between two payloads of the same match.
+
+    ``before`` is ``None`` the first time a match is seen, which only reports its
+    status. Only the parts that are reported on are compared, and every one of them
+    is skipped as a whole when it is unchanged, so diffing two equal payloads costs
+    a few dictionary comparisons.
+    """
+    match_id = after.get("match_id", "")
+    status = after.get("status")
+    if before is None:
+        return [StatusChanged(match_id, None, status)]
+    if before is after:
+        return []
+
+    events: List[MatchEvent] = []
+    if before.get("status") != status:
+        events.append(StatusChanged(match_id, before.get("status"), status))
+
+    old_results, new_results = before.get("results"), after.get("results")
+    if old_results != new_results:
+        old_score = old_results.get("score") if old_results else None
+        new_score = new_results.get("score") if new_results else None
+        if old_score != new_score:
+            events.append(ScoreChanged(match_id, old_score, new_score, new_results.get("winner") if new_results else None))
+
+    old_voting, new_voting = before.get("voting"), after.get("voting")
+    if old_voting != new_voting and new_voting:
+        old_pick = ((old_voting or {}).get("map") or {}).get("pick")
+        new_pick = (new_voting.get("map") or {}).get("pick")
+        if new_pick and new_pick != old_pick:
+            events.append(MapDecided(match_id, list(new_pick)))
+
+    old_teams, new_teams = before.get("teams"), after.get("teams")
+    if old_teams != new_teams and old_teams and new_teams:
+        for key, new_faction in new_teams.items():
+            old_faction = old_teams.get(key)
+            if old_faction is None or old_faction == new_faction:
+                continue
+            if old_faction.get("roster") == new_faction.get("roster") and not (
+                new_faction.get("substituted") and not old_faction.get("substituted")
+            ):
+                continue
+            old_ids, new_ids = _roster_ids(old_faction), _roster_ids(new_faction)
+            joined = [player_id for player_id in new_ids if player_id not in old_ids]
+            left = [player_id for player_id in old_ids if player_id not in new_ids]
+            if joined or left:
+                events.append(RosterSubstituted(match_id, key, joined, left))
+    return events
+
+
+class MatchEventStream:
+    """An asynchronous iterator over the changes of watched matches.
+
+    The matches are polled by a :class:`MatchWatcher` and every payload is compared
+    to the previous one of the same match with :func:`diff_match`; only the changes
+    are yielded. Polls that change nothing and failed polls yield nothing.
+
+    This is usually not created directly, see :meth:`Client.match_events`.
+
+    Parameters
+    ----------
+    watcher: :class:`MatchWatcher`
+        The watcher polling the matches. It must yield raw payloads.
+    """
+
+    def __init__(self, watcher: MatchWatcher) -> None:
+        self.watcher: MatchWatcher = watcher
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<MatchEventStream watcher={self.watcher!r}>"
+
+    def __aiter__(self) -> AsyncIterator[MatchEvent]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[MatchEvent]:
+        async for result in self.watcher:
+            if not result.ok:
+                _log.debug(f"Polling match {result.key} failed: {result.error!r}")
+                if result.key not in self.watcher:
+                    self._last.pop(result.key, None)
+                continue
+            data = result.result
+            for event in diff_match(self._last.get(result.key), data):
+                yield event
+            if result.key in self.watcher:
+                self._last[result.key] = data
+            else:
+                # The watcher is done with the match, so are we
+                self._last.pop(result.key, None)
@@ -0,0 +1,468 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import io
+import logging
+import os
+from typing import Any, AsyncIterable, Callable, Dict, Iterator, List, Optional, Union
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ModuleNotFoundError:
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+from .bulk import BulkResult
+from .game import Game
+from .match import Match
+from .player import Player
+from .utils import _to_json
+
+__all__ = (
+    "flatten_match",
+    "flatten_player",
+    "flatten_game",
+    "NDJSONWriter",
+    "ParquetWriter",
+    "ArrowWriter",
+    "export",
+)
+
+
+_log = logging.getLogger(__name__)
+
+Record = Union[Match, Player, Game, Dict[str, Any]]
+
+# The columns of the flattened rows of every kind, as name -> type
+COLUMNS: Dict[str, Dict[str, str]] = {
+    "match": {
+        "match_id": "string",
+        "status": "string",
+        "game": "string",
+        "region": "string",
+        "competition_id": "string",
+        "competition_name": "string",
+        "competition_type": "string",
+        "organizer_id": "string",
+        "best_of": "int64",
+        "configured_at": "int64",
+        "started_at": "int64",
+        "finished_at": "int64",
+        "maps": "string",
+        "winner": "string",
+        "faction": "string",
+        "faction_id": "string",
+        "faction_name": "string",
+        "faction_type": "string",
+        "faction_substituted": "bool",
+        "faction_score": "int64",
+        "faction_skill_level": "double",
+        "player_id": "string",
+        "nickname": "string",
+        "membership": "string",
+        "game_player_id": "string",
+        "game_player_name": "string",
+        "game_skill_level": "int64",
+        "anticheat_required": "bool",
+    },
+    "player": {
+        "player_id": "string",
+        "nickname": "string",
+        "country": "string",
+        "membership_type": "string",
+        "verified": "bool",
+        "activated_at": "string",
+        "steam_id_64": "string",
+        "faceit_url": "string",
+        "game": "string",
+        "region": "string",
+        "skill_level": "int64",
+        "faceit_elo": "int64",
+        "game_player_id": "string",
+        "game_player_name": "string",
+        "skill_level_label": "string",
+    },
+    "game": {
+        "game_id": "string",
+        "short_label": "string",
+        "long_label": "string",
+        "order": "int64",
+        "parent_game_id": "string",
+        "platforms": "string",
+        "regions": "string",
+    },
+}
+
+
+def _payload(record: Record) -> Dict[str, Any]:
+    if isinstance(record, dict):
+        return record
+    return record.to_dict()
+
+
+def _joined(values: Any) -> Optional[str]:
+    return ",".join(map(str, values)) if values else None
+
+
+def flatten_match(record: Union[Match, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield one row per player of a match, with the match and faction fields repeated
+    on every row. A match without teams yields a single row without player fields.
+    """
+    data = _payload(record)
+    results = data.get("results") or {}
+    score = results.get("score") or {}
+    voting_map = (data.get("voting") or {}).get("map") or {}
+    match_row = {
+        "match_id": data.get("match_id"),
+        "status": data.get("status"),
+        "game": data.get("game"),
+        "region": data.get("region"),
+        "competition_id": data.get("competition_id"),
+        "competition_name": data.get("competition_name"),
+        "competition_type": data.get("competition_type"),
+        "organizer_id": data.get("organizer_id"),
+        "best_of": data.get("best_of"),
+        "configured_at": data.get("configured_at"),
+        "started_at": data.get("started_at"),
+        "finished_at": data.get("finished_at"),
+        "maps": _joined(voting_map.get("pick")),
+        "winner": results.get("winner"),
+    }
+    teams = data.get("teams") or {}
+    if not teams:
+        yield match_row
+        return
+    for faction, team in teams.items():
+        skill_level = ((team.get("stats") or {}).get("skillLevel") or {}).get("average")
+        faction_row = dict(
+            match_row,
+            faction=faction,
+            faction_id=team.get("faction_id"),
+            faction_name=team.get("name"),
+            faction_type=team.get("type"),
+            faction_substituted=team.get("substituted"),
+            faction_score=score.get(faction),
+            faction_skill_level=float(skill_level) if skill_level is not None else None,
+        )
+        for player in team.get("roster") or ():
+            yield dict(
+                faction_row,
+                player_id=player.get("player_id"),
+                nickname=player.get("nickname"),
+                membership=player.get("membership"),
+                game_player_id=player.get("game_player_id"),
+                game_player_name=player.get("game_player_name"),
+                game_skill_level=player.get("game_skill_level"),
+                anticheat_required=player.get("anticheat_required"),
+            )
+
+
+def flatten_player(record: Union[Player, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield one row per game of a player, with the player fields repeated on every row.
+    A player without games yields a single row without game fields.
+    """
+    data = _payload(record)
+    player_row = {
+        "player_id": data.get("player_id"),
+        "nickname": data.get("nickname"),
+        "country": data.get("country"),
+        "membership_type": data.get("membership_type"),
+        "verified": data.get("verified"),
+        "activated_at": data.get("activated_at"),
+        "steam_id_64": data.get("steam_id_64"),
+        "faceit_url": data.get("faceit_url"),
+    }
+    games = data.get("games") or {}
+    if not games:
+        yield player_row
+        return
+    for game, details in games.items():
+        yield dict(
+            player_row,
+            game=game,
+            region=details.get("region"),
+            skill_level=details.get("skill_level"),
+            faceit_elo=details.get("faceit_elo"),
+            game_player_id=details.get("game_player_id"),
+            game_player_name=details.get("game_player_name"),
+            skill_level_label=details.get("skill_level_label"),
+        )
+
+
+def flatten_game(record: Union[Game, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield the single row of a game."""
+    data = _payload(record)
+    yield {
+        "game_id": data.get("game_id"),
+        "short_label": data.get("short_label"),
+        "long_label": data.get("long_label"),
+        "order": data.get("order"),
+        "parent_game_id": data.get("parent_game_id"),
+        "platforms": _joined(data.get("platforms")),
+        "regions": _joined(data.get("regions")),
+    }
+
+
+_FLATTENERS = {
+    "match": flatten_match,
+    "player": flatten_player,
+    "game": flatten_game,
+}
+
+
+class NDJSONWriter:
+    """Writes rows as newline-delimited JSON, one object per line.
+
+    Parameters
+    ----------
+    file: Union[:class:`str`, :class:`os.PathLike`, :class:`io.TextIOBase`]
+        The file to write to. Files opened by the writer are closed by :meth:`close`.
+    """
+
+    def __init__(self, file: Union[str, "os.PathLike[str]", io.TextIOBase]) -> None:
+        self._owned = not isinstance(file, io.TextIOBase)
+        self._file = open(file, "w", encoding="utf-8") if self._owned else file  # type: ignore
+        self.rows: int = 0
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        self._file.write(_to_json(row))
+        self._file.write("\n")
+        self.rows += 1
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class _ArrowBatchWriter:
+    # Buffers rows into row groups of a fixed schema and hands them to a pyarrow writer
+
+    def __init__(self, kind: str, row_group_size: int) -> None:
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow is required to write Parquet and Arrow files, install faceit.py[export]")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        self.schema = pa.schema([(name, pa.type_for_alias(type_)) for name, type_ in COLUMNS[kind].items()])
+        self.row_group_size: int = row_group_size
+        self.rows: int = 0
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self.schema.names}
+        self._buffered = 0
+
+    def __enter__(self) -> "_ArrowBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        # Rows are buffered by column, which is what pyarrow builds its arrays from
+        for name, values in self._columns.items():
+            values.append(row.get(name))
+        self._buffered += 1
+        self.rows += 1
+        if self._buffered >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffered:
+            return
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(self._columns.values(), self.schema)],
+            schema=self.schema,
+        )
+        self._write_batch(batch)
+        for values in self._columns.values():
+            values.clear()
+        self._buffered = 0
+
+    def _write_batch(self, batch: "pa.RecordBatch") -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self._flush()
+
+
+class ParquetWriter(_ArrowBatchWriter):
+    """Writes rows to a Parquet file, ``row_group_size`` rows per row group.
+
+    Requires pyarrow. Only one row group is held in memory at a time.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to write to.
+    kind: :class:`str`
+        The kind of rows, ``match``, ``player`` or ``game``, which decides the schema.
+    row_group_size: :class:`int`
+        The number of rows per row group. Defaults to 65536.
+    compression: :class:`str`
+        The Parquet compression codec. Defaults to ``zstd``.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], kind: str, *, row_group_size: int = 65536, compression: str = "zstd"
+    ) -> None:
+        super().__init__(kind, row_group_size)
+        self._writer = pq.ParquetWriter(os.fspath(path), self.schema, compression=compression)
+
+    def _write_batch(self, batch: "pa.RecordBatch") -> None:
+        self._writer.write_batch(batch, row_group_size=self.row_group_size)
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+class ArrowWriter(_ArrowBatchWriter):
+    """Writes rows to an Arrow IPC file, ``row_group_size`` rows per record batch.
+
+    Requires pyarrow. Only one record batch is held in memory at a time.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to write to.
+    kind: :class:`str`
+        The kind of rows, ``match``, ``player`` or ``game``, which decides the schema.
+    row_group_size: :class:`int`
+        The number of rows per record batch. Defaults to 65536.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], kind: str, *, row_group_size: int = 65536) -> None:
+        super().__init__(kind, row_group_size)
+        self._sink = pa.OSFile(os.fspath(path), "wb")
+        self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def _write_batch(self, batch: "pa.RecordBatch") -> None:
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+        self._sink.close()
+
+
+# File suffix -> writer
+_FORMATS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+
+def _kind_of(record: Record) -> str:
+    if isinstance(record, Match) or (isinstance(record, dict) and "match_id" in record):
+        return "match"
+    if isinstance(record, Player) or (isinstance(record, dict) and "player_id" in record):
+        return "player"
+    if isinstance(record, Game) or (isinstance(record, dict) and "game_id" in record):
+        return "game"
+    raise TypeError(f"Can't export {type(record).__name__}")
+
+
+async def export(
+    records: AsyncIterable[Any],
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    kind: Optional[str] = None,
+    format: Optional[str] = None,
+    row_group_size: int = 65536,
+) -> int:
+    """*coroutine*
+    Flatten every record of an asynchronous iterator and write the rows to a file.
+
+    Records are written as they arrive, so memory use does not grow with their
+    number. Records can be :class:`Match`, :class:`Player` or :class:`Game` models,
+    their raw payloads, or :class:`BulkResult` of them, in which case failed results
+    are skipped.
+
+    .. code-block:: python3
+
+        rows = await faceit.export(client.get_matches(match_ids), "matches.parquet")
+
+    Parameters
+    ----------
+    records: AsyncIterable[Any]
+        The records, e.g. from :meth:`Client.get_matches` or :meth:`Client.iter_games`.
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to write to.
+    kind: Optional[:class:`str`]
+        ``match``, ``player`` or ``game``. Detected from the first record by default.
+    format: Optional[:class:`str`]
+        ``ndjson``, ``parquet`` or ``arrow``. Detected from the file suffix by default.
+    row_group_size: :class:`int`
+        The number of rows per Parquet row group or Arrow record batch. Defaults to 65536.
+
+    Returns
+    -------
+    :class:`int`
+        The number of rows written.
+    """
+    if format is None:
+        format = _FORMATS.get(os.path.splitext(os.fspath(path))[1].lower())
+        if format is None:
+            raise ValueError(f"Can't tell the format of {os.fspath(path)!r}, pass format=")
+    if format not in ("ndjson", "parquet", "arrow"):
+        raise ValueError(f"format must be ndjson, parquet or arrow, not {format!r}")
+    if kind is not None and kind not in _FLATTENERS:
+        raise ValueError(f"kind must be match, player or game, not {kind!r}")
+
+    def open_writer(kind: str) -> Any:
+        if format == "ndjson":
+            return NDJSONWriter(path)
+        if format == "parquet":
+            return ParquetWriter(path, kind, row_group_size=row_group_size)
+        return ArrowWriter(path, kind, row_group_size=row_group_size)
+
+    writer = open_writer(kind) if kind is not None else None
+    flatten: Optional[Callable[[Any], Iterator[Dict[str, Any]]]] = _FLATTENERS[kind] if kind is not None else None
+    try:
+        async for record in records:
+            if isinstance(record, BulkResult):
+                if not record.ok:
+                    _log.debug(f"Not exporting {record.key}, it failed with {record.error!r}")
+                    continue
+                record = record.result
+            if writer is None:
+                kind = _kind_of(record)
+                writer = open_writer(kind)
+                flatten = _FLATTENERS[kind]
+            for row in flatten(record):  # type: ignore
+                writer.write_row(row)
+    finally:
+        if writer is not None:
+            writer.close()
+    return writer.rows if writer is not None else 0
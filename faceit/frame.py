@@ -0,0 +1,354 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import math
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+from .match import Match
+
+__all__ = ("MatchFrame",)
+
+
+NAN = math.nan
+FACTIONS = ("faction1", "faction2")
+
+# name -> array typecode, missing values are NaN for floats and 0 for integers
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "best_of": "b",
+    "configured_at": "d",
+    "scheduled_at": "d",
+    "started_at": "d",
+    "finished_at": "d",
+    "faction1_rating": "d",
+    "faction2_rating": "d",
+    "faction1_win_probability": "d",
+    "faction2_win_probability": "d",
+    "faction1_skill_level": "d",
+    "faction2_skill_level": "d",
+    "faction1_score": "d",
+    "faction2_score": "d",
+}
+CATEGORICAL_COLUMNS: Tuple[str, ...] = ("region", "status", "game", "competition_type", "winner")
+ROSTER_COLUMNS: Dict[str, str] = {
+    "roster_match": "I",
+    "roster_faction": "B",
+    "roster_skill_level": "b",
+}
+
+Column = Union[array, "np.ndarray"]
+Mask = Union[Sequence[bool], "np.ndarray"]
+
+
+def _number(value: Any) -> float:
+    return NAN if value is None else value
+
+
+class _Categorical:
+    """A dictionary encoded string column, low-cardinality values are stored once."""
+
+    __slots__ = (
+        "codes",
+        "categories",
+        "_lookup",
+    )
+
+    def __init__(self) -> None:
+        self.codes: array = array("H")
+        self.categories: List[Optional[str]] = []
+        self._lookup: Dict[Optional[str], int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def code_of(self, value: Optional[str]) -> Optional[int]:
+        return self._lookup.get(value)
+
+    def take(self, indices: Sequence[int]) -> "_Categorical":
+        other = _Categorical()
+        other.categories = self.categories
+        other._lookup = self._lookup
+        other.codes = _take(self.codes, indices)
+        return other
+
+
+class MatchFrame:
+    """A columnar batch of matches for analytics over many of them.
+
+    Instead of a tree of :class:`Faction`, :class:`Roster` and :class:`Stats`
+    objects per match, every field is stored in one typed array for the whole
+    batch. Low-cardinality strings such as ``region`` or ``status`` are
+    dictionary encoded. Roster entries live in a second table of their own, one
+    row per player per match, linked to their match by ``roster_match``.
+
+    Columns are returned as NumPy arrays (without copying) when NumPy is
+    installed and as :class:`array.array` otherwise. Filtering and aggregation
+    use NumPy when available and plain loops over the arrays when not. As the
+    NumPy arrays are views, :meth:`append` fails while any of them is alive.
+
+    Missing numbers are stored as NaN in float columns and as 0 in integer columns.
+
+    .. code-block:: python3
+
+        frame = MatchFrame.from_matches(matches)
+        finished_eu = frame.filter(frame.mask(status="FINISHED", region="EU"))
+        print(finished_eu.mean("faction1_rating"), finished_eu.skill_level_counts())
+    """
+
+    def __init__(self) -> None:
+        self._match_ids: List[str] = []
+        self._numeric: Dict[str, array] = {name: array(typecode) for name, typecode in NUMERIC_COLUMNS.items()}
+        self._categorical: Dict[str, _Categorical] = {name: _Categorical() for name in CATEGORICAL_COLUMNS}
+        self._roster: Dict[str, array] = {name: array(typecode) for name, typecode in ROSTER_COLUMNS.items()}
+        self._roster_player_ids: List[str] = []
+
+    def __repr__(self) -> str:
+        return f"MatchFrame(matches={len(self)}, roster_rows={len(self._roster_player_ids)})"
+
+    def __len__(self) -> int:
+        return len(self._match_ids)
+
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[Dict[str, Any]]) -> "MatchFrame":
+        """Build a frame from decoded ``/matches/{match_id}`` payloads."""
+        frame = cls()
+        for data in payloads:
+            frame.append(data)
+        return frame
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Match]) -> "MatchFrame":
+        """Build a frame from :class:`Match` objects."""
+        frame = cls()
+        for match in matches:
+            frame.append(
+                {
+                    "match_id": match._match_id,
+                    "best_of": match._best_of,
+                    "configured_at": match._configured_at,
+                    "scheduled_at": match._scheduled_at,
+                    "started_at": match._started_at,
+                    "finished_at": match._finished_at,
+                    "region": match._region,
+                    "status": match._status,
+                    "game": match._game,
+                    "competition_type": match._competition_type,
+                    "results": match._results,
+                    "teams": match._teams,
+                }
+            )
+        return frame
+
+    def append(self, data: Dict[str, Any]) -> None:
+        """Add a single decoded match payload to the frame."""
+        index = len(self._match_ids)
+        numeric = self._numeric
+        categorical = self._categorical
+
+        self._match_ids.append(data.get("match_id"))
+        numeric["best_of"].append(data.get("best_of") or 0)
+        for name in ("configured_at", "scheduled_at", "started_at", "finished_at"):
+            numeric[name].append(_number(data.get(name)))
+        for name in ("region", "status", "game", "competition_type"):
+            categorical[name].append(data.get(name))
+
+        results = data.get("results") or {}
+        score = results.get("score") or {}
+        categorical["winner"].append(results.get("winner"))
+
+        teams = data.get("teams") or {}
+        for faction_index, key in enumerate(FACTIONS):
+            faction = teams.get(key) or {}
+            stats = faction.get("stats") or {}
+            skill_level = stats.get("skillLevel") or {}
+            numeric[f"{key}_rating"].append(_number(stats.get("rating")))
+            numeric[f"{key}_win_probability"].append(_number(stats.get("winProbability")))
+            numeric[f"{key}_skill_level"].append(_number(skill_level.get("average")))
+            numeric[f"{key}_score"].append(_number(score.get(key)))
+
+            for roster in faction.get("roster") or ():
+                self._roster["roster_match"].append(index)
+                self._roster["roster_faction"].append(faction_index + 1)
+                self._roster["roster_skill_level"].append(roster.get("game_skill_level") or 0)
+                self._roster_player_ids.append(roster.get("player_id"))
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return ("match_id", *NUMERIC_COLUMNS, *CATEGORICAL_COLUMNS, "roster_player_id", *ROSTER_COLUMNS)
+
+    @property
+    def match_ids(self) -> List[str]:
+        return self._match_ids
+
+    @property
+    def roster_player_ids(self) -> List[str]:
+        return self._roster_player_ids
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate memory used by the frame in bytes, including the strings."""
+        total = sum(column.buffer_info()[1] * column.itemsize for column in self._numeric.values())
+        total += sum(column.buffer_info()[1] * column.itemsize for column in self._roster.values())
+        total += sum(
+            column.codes.buffer_info()[1] * column.codes.itemsize
+            + sum(sys.getsizeof(value) for value in column.categories if value is not None)
+            for column in self._categorical.values()
+        )
+        for strings in (self._match_ids, self._roster_player_ids):
+            total += sys.getsizeof(strings) + sum(sys.getsizeof(value) for value in strings)
+        return total
+
+    def __getitem__(self, name: str) -> Column:
+        """Return a numeric column, or the codes of a categorical column."""
+        if name in self._numeric:
+            return _wrap(self._numeric[name])
+        if name in self._roster:
+            return _wrap(self._roster[name])
+        if name in self._categorical:
+            return _wrap(self._categorical[name].codes)
+        raise KeyError(name)
+
+    def categories(self, name: str) -> List[Optional[str]]:
+        """Return the values of a categorical column, indexed by code."""
+        return list(self._categorical[name].categories)
+
+    def decode(self, name: str) -> List[Optional[str]]:
+        """Return a categorical column as a list of its values."""
+        column = self._categorical[name]
+        categories = column.categories
+        return [categories[code] for code in column.codes]
+
+    def mask(self, **conditions: Union[str, Iterable[str], None]) -> Mask:
+        """Return a boolean mask of the matches whose categorical columns equal the given values.
+
+        A condition may also be an iterable of accepted values, e.g. ``region=("EU", "NA")``.
+        """
+        result: Optional[Mask] = None
+        for name, accepted in conditions.items():
+            column = self._categorical[name]
+            values = (accepted,) if accepted is None or isinstance(accepted, str) else tuple(accepted)
+            codes = {code for code in map(column.code_of, values) if code is not None}
+            if HAS_NUMPY:
+                current = np.isin(_wrap(column.codes), list(codes))
+                result = current if result is None else result & current
+            else:
+                current = [code in codes for code in column.codes]
+                result = current if result is None else [a and b for a, b in zip(result, current)]
+        if result is None:
+            return np.ones(len(self), dtype=bool) if HAS_NUMPY else [True] * len(self)
+        return result
+
+    def filter(self, mask: Mask) -> "MatchFrame":
+        """Return a new frame with the matches selected by a boolean mask, together with their roster rows."""
+        if len(mask) != len(self):
+            raise ValueError(f"mask has {len(mask)} entries, expected {len(self)}")
+
+        roster_match = self._roster["roster_match"]
+        if HAS_NUMPY:
+            keep = np.asarray(mask, dtype=bool)
+            indices = np.flatnonzero(keep)
+            roster_rows = np.flatnonzero(keep[_wrap(roster_match)])
+            # Map old match indices to their position in the new frame
+            new_index = np.cumsum(keep) - 1
+            remapped = _from_numpy("I", new_index[_wrap(roster_match)[roster_rows]])
+        else:
+            keep = [bool(flag) for flag in mask]
+            indices = list(compress(range(len(keep)), keep))
+            roster_rows = [row for row, match in enumerate(roster_match) if keep[match]]
+            new_index = [-1] * len(keep)
+            for position, index in enumerate(indices):
+                new_index[index] = position
+            remapped = array("I", [new_index[roster_match[row]] for row in roster_rows])
+
+        frame = MatchFrame()
+        frame._match_ids = [self._match_ids[i] for i in indices]
+        frame._numeric = {name: _take(column, indices) for name, column in self._numeric.items()}
+        frame._categorical = {name: column.take(indices) for name, column in self._categorical.items()}
+        frame._roster = {name: _take(column, roster_rows) for name, column in self._roster.items()}
+        frame._roster["roster_match"] = remapped
+        frame._roster_player_ids = [self._roster_player_ids[row] for row in roster_rows]
+        return frame
+
+    def mean(self, name: str) -> float:
+        """Return the mean of a numeric column, ignoring missing values."""
+        column = self[name]
+        if HAS_NUMPY:
+            values = column.astype(float)
+            values = values[~np.isnan(values)]
+            return float(values.mean()) if len(values) else NAN
+        values = [value for value in column if value == value]
+        return math.fsum(values) / len(values) if values else NAN
+
+    def value_counts(self, name: str) -> Dict[Optional[str], int]:
+        """Return how often each value of a categorical column occurs."""
+        column = self._categorical[name]
+        if HAS_NUMPY:
+            counts = np.bincount(_wrap(column.codes), minlength=len(column.categories))
+        else:
+            counts = [0] * len(column.categories)
+            for code in column.codes:
+                counts[code] += 1
+        return {value: int(count) for value, count in zip(column.categories, counts) if count}
+
+    def skill_level_counts(self) -> Dict[int, int]:
+        """Return how many roster entries there are per ``game_skill_level``."""
+        column = self._roster["roster_skill_level"]
+        if HAS_NUMPY:
+            counts = np.bincount(_wrap(column).astype(np.int64), minlength=11)
+            return {level: int(count) for level, count in enumerate(counts) if count and level}
+        # Levels aren't bounded, so count them by value rather than into a fixed-size list
+        counts = Counter(column)
+        return {level: counts[level] for level in sorted(counts) if level}
+
+
+def _wrap(column: array) -> Column:
+    if HAS_NUMPY:
+        return np.frombuffer(column, dtype=column.typecode) if len(column) else np.array([], dtype=column.typecode)
+    return column
+
+
+def _from_numpy(typecode: str, values: "np.ndarray") -> array:
+    result = array(typecode)
+    result.frombytes(values.astype(typecode).tobytes())
+    return result
+
+
+def _take(column: array, indices: Sequence[int]) -> array:
+    if HAS_NUMPY:
+        return _from_numpy(column.typecode, _wrap(column)[indices])
+    return array(column.typecode, [column[i] for i in indices])
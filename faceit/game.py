@@ -24,13 +24,15 @@ SOFTWARE.
 
 from typing import Any, Dict, List
 
+from .utils import _Model
+
 __all__ = (
     "GameAssets",
     "Game",
 )
 
 
-class GameAssets:
+class GameAssets(_Model):
 
     __slots__ = (
         "_cover",
@@ -46,8 +48,8 @@ class GameAssets:
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
         self._cover = data.get("cover")
-        self._featured_img_l = data.get("cover")
-        self._featured_img_m = data.get("featured_img_l")
+        self._featured_img_l = data.get("featured_img_l")
+        self._featured_img_m = data.get("featured_img_m")
         self._featured_img_s = data.get("featured_img_s")
         self._flag_img_icon = data.get("flag_img_icon")
         self._flag_img_l = data.get("flag_img_l")
@@ -56,7 +58,7 @@ class GameAssets:
         self._landing_page = data.get("landing_page")
 
     def __repr__(self) -> str:
-        return f"GameAssets(data={{'cover': '{self._cover}', 'featured_img_l': '{self._featured_img_l}', '_featured_img_m': '{self._featured_img_m}', 'featured_img_s': '{self._featured_img_s}', 'flag_img_icon': '{self._flag_img_icon}', 'flag_img_l': '{self._flag_img_l}', 'flag_img_m': '{self._flag_img_m}', 'flag_img_s': '{self._flag_img_s}', 'landing_page': '{self._landing_page}'}})"
+        return f"GameAssets(data={{'cover': '{self._cover}', 'featured_img_l': '{self._featured_img_l}', 'featured_img_m': '{self._featured_img_m}', 'featured_img_s': '{self._featured_img_s}', 'flag_img_icon': '{self._flag_img_icon}', 'flag_img_l': '{self._flag_img_l}', 'flag_img_m': '{self._flag_img_m}', 'flag_img_s': '{self._flag_img_s}', 'landing_page': '{self._landing_page}'}})"
 
     @property
     def cover(self) -> str:
@@ -95,7 +97,7 @@ class GameAssets:
         return self._landing_page
 
 
-class Game:
+class Game(_Model):
     """Represents a game."""
 
     __slots__ = (
@@ -107,6 +109,7 @@ class Game:
         "_platforms",
         "_regions",
         "_short_label",
+        "_cached_assets",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
@@ -118,13 +121,16 @@ class Game:
         self._platforms = data.get("platforms")
         self._regions = data.get("regions")
         self._short_label = data.get("short_label")
+        self._cached_assets = None
 
     def __repr__(self) -> str:
         return f"Game(data={{'assets': {self._assets}, 'game_id': '{self._game_id}', 'long_label': '{self._long_label}', 'order': {self._order}, 'parent_game_id': '{self._parent_game_id}', 'platforms': {self._platforms}, 'regions': {self._regions}, 'short_label': '{self._short_label}'}})"
 
     @property
     def assets(self) -> GameAssets:
-        return GameAssets(data=self._assets)
+        if self._cached_assets is None:
+            self._cached_assets = GameAssets(data=self._assets)
+        return self._cached_assets
 
     @property
     def game_id(self) -> str:
@@ -0,0 +1,250 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from .bulk import BulkResult, bulk_fetch
+from .match import MatchHistoryItem
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = (
+    "HistoryCheckpoint",
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "SQLiteCheckpointStore",
+    "HistorySync",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class HistoryCheckpoint:
+    """The most recent match of a player that :class:`HistorySync` has seen.
+
+    Attributes
+    ----------
+    player_id: :class:`str`
+        The ID of the player.
+    finished_at: :class:`int`
+        The Unix timestamp the match finished at.
+    match_id: :class:`str`
+        The ID of the match.
+    synced_at: :class:`float`
+        The Unix timestamp of the sync that stored the checkpoint.
+    """
+
+    __slots__ = (
+        "player_id",
+        "finished_at",
+        "match_id",
+        "synced_at",
+    )
+
+    def __init__(self, player_id: str, finished_at: int, match_id: str, synced_at: Optional[float] = None) -> None:
+        self.player_id: str = player_id
+        self.finished_at: int = finished_at
+        self.match_id: str = match_id
+        self.synced_at: float = synced_at if synced_at is not None else time.time()
+
+    def __repr__(self) -> str:
+        return f"HistoryCheckpoint(player_id={self.player_id!r}, finished_at={self.finished_at}, match_id={self.match_id!r})"
+
+
+class CheckpointStore:
+    """The interface of the places :class:`HistorySync` keeps its checkpoints in."""
+
+    def get(self, player_id: str) -> Optional[HistoryCheckpoint]:
+        raise NotImplementedError
+
+    def set(self, checkpoint: HistoryCheckpoint) -> None:
+        raise NotImplementedError
+
+    def delete(self, player_id: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Keeps checkpoints in a dictionary. They are lost when the process exits."""
+
+    def __init__(self) -> None:
+        self._checkpoints: Dict[str, HistoryCheckpoint] = {}
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    def get(self, player_id: str) -> Optional[HistoryCheckpoint]:
+        return self._checkpoints.get(player_id)
+
+    def set(self, checkpoint: HistoryCheckpoint) -> None:
+        self._checkpoints[checkpoint.player_id] = checkpoint
+
+    def delete(self, player_id: str) -> None:
+        self._checkpoints.pop(player_id, None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keeps checkpoints in a SQLite database, so a restarted sync resumes where it stopped.
+
+    Every checkpoint is committed on its own as soon as a player is synced.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The database file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path: str = os.fspath(path)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS history_checkpoints ("
+            "player_id TEXT PRIMARY KEY, finished_at INTEGER NOT NULL, match_id TEXT NOT NULL, synced_at REAL NOT NULL)"
+        )
+
+    def __repr__(self) -> str:
+        return f"SQLiteCheckpointStore(path={self.path!r})"
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM history_checkpoints").fetchone()[0]
+
+    def get(self, player_id: str) -> Optional[HistoryCheckpoint]:
+        row = self._db.execute(
+            "SELECT finished_at, match_id, synced_at FROM history_checkpoints WHERE player_id = ?", (player_id,)
+        ).fetchone()
+        return HistoryCheckpoint(player_id, *row) if row is not None else None
+
+    def set(self, checkpoint: HistoryCheckpoint) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO history_checkpoints (player_id, finished_at, match_id, synced_at) VALUES (?, ?, ?, ?)",
+            (checkpoint.player_id, checkpoint.finished_at, checkpoint.match_id, checkpoint.synced_at),
+        )
+
+    def delete(self, player_id: str) -> None:
+        self._db.execute("DELETE FROM history_checkpoints WHERE player_id = ?", (player_id,))
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class HistorySync:
+    """Keeps track of the new matches of many players.
+
+    For every player the most recent match seen is stored as a
+    :class:`HistoryCheckpoint`. A sync only asks the API for matches that finished
+    after the checkpoint and stops paging as soon as it reaches a match it already
+    knows, so players without new matches cost a single request. The first sync of
+    a player walks their whole history.
+
+    .. code-block:: python3
+
+        sync = faceit.HistorySync(client, "cs2", faceit.SQLiteCheckpointStore("history.db"))
+        async for result in sync.sync(player_ids):
+            for match in result.result or []:
+                print(result.key, match.match_id)
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to fetch the histories with.
+    game: :class:`str`
+        The ID of the game, e.g. ``cs2``.
+    store: Optional[:class:`CheckpointStore`]
+        Where checkpoints are kept. Defaults to a :class:`MemoryCheckpointStore`.
+    page_size: :class:`int`
+        The number of matches per request, at most 100. Defaults to 100.
+    raw: Optional[:class:`bool`]
+        Return the decoded JSON payloads instead of :class:`MatchHistoryItem`. Defaults to the
+        ``raw`` setting of the client.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        game: str,
+        store: Optional[CheckpointStore] = None,
+        *,
+        page_size: int = 100,
+        raw: Optional[bool] = None,
+    ) -> None:
+        self.client: "Client" = client
+        self.game: str = game
+        self.store: CheckpointStore = store if store is not None else MemoryCheckpointStore()
+        self.page_size: int = page_size
+        self.raw: Optional[bool] = raw
+
+    def __repr__(self) -> str:
+        return f"<HistorySync game={self.game!r} store={self.store!r}>"
+
+    async def sync_player(self, player_id: str) -> List[Union[MatchHistoryItem, Dict[str, Any]]]:
+        """*coroutine*
+        Return the matches a player finished since the last sync, the most recent first,
+        and move their checkpoint forward.
+        """
+        checkpoint = self.store.get(player_id)
+        # The lower bound is inclusive, the checkpoint's own match is recognized below
+        params: Dict[str, Any] = {"game": self.game, "from": checkpoint.finished_at if checkpoint is not None else 0}
+        new: List[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            params.update(offset=offset, limit=self.page_size)
+            items = (await self.client.http.get_player_history(player_id, params=params))["items"]
+            for item in items:
+                # Matches that are still running have no finish time yet, they are picked up once they finish
+                if item.get("finished_at") is None:
+                    continue
+                if checkpoint is not None and (
+                    item["match_id"] == checkpoint.match_id or item["finished_at"] < checkpoint.finished_at
+                ):
+                    break
+                new.append(item)
+            else:
+                if len(items) == self.page_size:
+                    offset += len(items)
+                    continue
+            break
+
+        if new:
+            self.store.set(HistoryCheckpoint(player_id, new[0]["finished_at"], new[0]["match_id"]))
+        _log.debug(f"Synced the history of {player_id}, {len(new)} new matches in {offset // self.page_size + 1} pages")
+        return [self.client._wrap(MatchHistoryItem, item, self.raw) for item in new]
+
+    def sync(
+        self, player_ids: Iterable[str], *, concurrency: int = 10
+    ) -> AsyncIterator[BulkResult[str, List[Union[MatchHistoryItem, Dict[str, Any]]]]]:
+        """Sync many players with at most ``concurrency`` requests in flight.
+
+        Players are yielded as soon as they are synced, with their new matches as
+        :attr:`BulkResult.result`. A failed player keeps their checkpoint and is
+        picked up again by the next sync.
+        """
+        return bulk_fetch(player_ids, self.sync_player, concurrency=concurrency)
@@ -23,39 +23,69 @@ SOFTWARE.
 """
 
 import asyncio
-import json
 import logging
 import ssl
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Union
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote as _uriquote
 
 import aiohttp
 
 from faceit import __version__
 
+from .cache import CacheBackend, CachePolicy
 from .errors import Forbidden, HTTPException, NotFound, ServiceUnavailable, Unauthorized
+from .keys import APIKeyPool
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .transport import AiohttpTransport, Transport, TransportResponse, _exchange_key
+from .utils import _from_json
 
 _log = logging.getLogger(__name__)
 
 
-async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str]:
-    text = await response.text(encoding="utf-8")
-    try:
-        if "application/json" in response.headers["content-type"]:
-            return json.loads(text)
-    except KeyError:
-        pass
+def json_or_text(response: TransportResponse) -> Union[Dict[str, Any], str]:
+    # JSON is parsed straight from the bytes, only other content types are decoded to text
+    if "application/json" in response.headers.get("content-type", ""):
+        return _from_json(response.body)
 
-    return text
+    return response.body.decode("utf-8")
 
 
 class Route:
     BASE = "https://open.faceit.com/data/v4"
 
-    def __init__(self, method: str, path: str) -> None:
+    def __init__(self, method: str, path: str, **parameters: Any) -> None:
         self.path: str = path
         self.method: str = method
-        self.url: str = self.BASE + self.path
+        url = self.BASE + self.path
+        if parameters:
+            url = url.format_map({k: _uriquote(v, safe="") if isinstance(v, str) else v for k, v in parameters.items()})
+        self.url: str = url
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def _request_key(route: Route, params: Optional[Dict[str, Any]]) -> str:
+    return _exchange_key(route.method, route.url, params)
+
+
+class _SharedRequest:
+    """An in-flight request shared by every caller that asked for the same URL."""
+
+    __slots__ = (
+        "task",
+        "waiters",
+    )
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task: asyncio.Task = task
+        self.waiters: int = 0
 
 
 class HTTPClient:
@@ -64,18 +94,35 @@ class HTTPClient:
         *,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        transport: Optional[Transport] = None,
+        key_pool: Optional[APIKeyPool] = None,
     ) -> None:
+        self.metrics: Optional[Metrics] = metrics
         # Checks if the faceit.Client was initialized before or after the event loop started
         # If it was not initialized, you have to call start_session()
         try:
             asyncio.get_running_loop()
-            self.__session = aiohttp.ClientSession()
+            self.__session = self._create_session()
         except RuntimeError:
             self.__session = None
         self.auth = None
+        self.api_key: Optional[str] = None
+        self.key_pool: Optional[APIKeyPool] = key_pool
         self.proxy: Optional[str] = proxy
         self.proxy_auth: Optional[aiohttp.BasicAuth] = proxy_auth
-        self.ratelimit_lock: asyncio.Lock = asyncio.Lock()
+        self.rate_limiter: RateLimiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.cache: Optional[CacheBackend] = cache
+        self.cache_policy: CachePolicy = cache_policy if cache_policy is not None else CachePolicy.recommended()
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.transport: Transport = transport if transport is not None else AiohttpTransport()
+        self._inflight: Dict[str, _SharedRequest] = {}
 
         user_agent = "faceit.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent: str = user_agent.format(__version__, sys.version_info, str(aiohttp.__version__))  #
@@ -86,9 +133,15 @@ class HTTPClient:
     async def close(self) -> None:
         if self.__session:
             await self.__session.close()
+        await self.transport.close()
 
     async def start_session(self):
-        self.__session = aiohttp.ClientSession()
+        self.__session = self._create_session()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        if self.metrics is not None:
+            return aiohttp.ClientSession(trace_configs=[self.metrics.trace_config()])
+        return aiohttp.ClientSession()
 
     async def request(
         self,
@@ -96,6 +149,70 @@ class HTTPClient:
         params: Optional[Iterable[Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> Any:
+        # Only plain GETs are coalesced, anything with a body or custom options goes out on its own
+        if route.method != "GET" or kwargs:
+            data, _ = await self._request(route, params, **kwargs)
+            return data
+
+        key = _request_key(route, params)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                _log.debug(f"{route.method} {route.url} with {params} was served from the cache")
+                if self.metrics is not None:
+                    self.metrics.increment("cache_hits", route.path)
+                return data
+
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = _SharedRequest(asyncio.create_task(self._request_and_cache(key, route, params)))
+            self._inflight[key] = shared
+            shared.task.add_done_callback(lambda task: self._finish_shared(key, shared))
+        else:
+            _log.debug(f"{route.method} {route.url} with {params} is already in flight, joining it")
+            if self.metrics is not None:
+                self.metrics.increment("coalesced", route.path)
+
+        shared.waiters += 1
+        try:
+            # The shield keeps a cancelled caller from cancelling the request for everyone else
+            return await asyncio.shield(shared.task)
+        except asyncio.CancelledError:
+            if shared.waiters == 1 and not shared.task.done():
+                # Forget the request first so callers arriving before the done callback start a fresh one
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+                shared.task.cancel()
+            raise
+        finally:
+            shared.waiters -= 1
+
+    def invalidate(self, route: Route, params: Optional[Dict[str, Any]] = None) -> None:
+        """Drop the cached response of a GET request, if any."""
+        if self.cache is not None:
+            self.cache.delete(_request_key(route, params))
+
+    def _finish_shared(self, key: str, shared: _SharedRequest) -> None:
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not shared.task.cancelled():
+            shared.task.exception()
+
+    async def _request_and_cache(self, key: str, route: Route, params: Optional[Dict[str, Any]]) -> Any:
+        data, size = await self._request(route, params)
+        if self.cache is not None:
+            # The body size is already known, so the cache doesn't have to serialize the payload to measure it
+            self.cache.set(key, data, ttl=self.cache_policy.ttl_for(route.path, data), size=size)
+        return data
+
+    async def _request(
+        self,
+        route: Route,
+        params: Optional[Iterable[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> Tuple[Any, int]:
+        # Returns the decoded payload along with the size of the raw body in bytes
         method = route.method
         url = route.url
 
@@ -113,33 +230,92 @@ class HTTPClient:
         if params:
             kwargs["params"] = params
 
-        async with self.ratelimit_lock:
-            for _ in range(2):
-                async with self.__session.request(method, url, auth=self.auth, **kwargs) as response:
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.increment("requests", route.path)
+            kwargs["trace_request_ctx"] = SimpleNamespace(route=route.path)
+            started = time.perf_counter()
+
+        try:
+            for attempt in range(self.retry_policy.max_attempts):
+                last_attempt = attempt == self.retry_policy.max_attempts - 1
+                if metrics is not None and attempt:
+                    metrics.increment("retries", route.path)
+                waited = await self.rate_limiter.acquire(route.path)
+                if metrics is not None:
+                    metrics.observe("ratelimit_wait_seconds", route.path, waited)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.check()
+                if self.key_pool is not None:
+                    key = await self.key_pool.acquire()
+                    headers["Authorization"] = key.header
+                    if metrics is not None:
+                        metrics.increment("key_requests", key.name)
+
+                try:
+                    response = await self.transport.request(self.__session, method, url, auth=self.auth, **kwargs)
                     _log.debug(f"{method} {url} with {params} has returned {response.status}")
 
-                    data = await json_or_text(response)
+                    if metrics is not None:
+                        metrics.increment(f"responses_{response.status}", route.path)
+                        metrics.observe("download_seconds", route.path, response.download)
+                        metrics.observe("response_bytes", route.path, len(response.body))
+                        decode_started = time.perf_counter()
+                        data = json_or_text(response)
+                        metrics.observe("decode_seconds", route.path, time.perf_counter() - decode_started)
+                    else:
+                        data = json_or_text(response)
+
+                    if self.circuit_breaker is not None:
+                        # Every response settles a half-open probe, only server errors count against the API
+                        if response.status >= 500 or response.status in self.retry_policy.retry_statuses:
+                            self.circuit_breaker.record_failure()
+                        else:
+                            self.circuit_breaker.record_success()
 
                     if 300 > response.status >= 200:
                         _log.debug(f"{method} {url} has received {data}")
-                        return data
+                        return data, len(response.body)
+
+                    if response.status in self.retry_policy.retry_statuses:
+                        if not last_attempt:
+                            delay = self.retry_policy.backoff(attempt, response.headers.get("Retry-After"))
+                            _log.debug(f"{method} {url} has returned {response.status}, retrying in {delay:.2f} seconds")
+                            await asyncio.sleep(delay)
+                            continue
+
+                    if self.key_pool is not None and response.status in {401, 429}:
+                        # Only this key is set aside, the request is retried with another one
+                        self.key_pool.record(key, response.status, response.headers.get("Retry-After"))
+                        if not last_attempt and (response.status == 429 or self.key_pool.available):
+                            continue
+                    elif response.status == 429:
+                        # We are getting rate-limited, hold back every request for as long as the API asks us to
+                        retry_after = self.rate_limiter.block(response.headers.get("Retry-After"))
+                        _log.debug(f"{method} {url} is getting rate-limited, retry after {retry_after} seconds")
+                        if not last_attempt:
+                            continue
 
                     if response.status in {500, 503}:
                         raise ServiceUnavailable(response, data)
-
                     if response.status == 401:
                         raise Unauthorized(response, data)
                     if response.status == 403:
                         raise Forbidden(response, data)
                     if response.status == 404:
                         raise NotFound(response, data)
-                    if response.status == 429:
-                        # We are getting rate-limited, read retry-after header and try again
-                        retry_after = int(headers.get("Retry-After", 60))
-                        _log.debug(f"{method} {url} is getting rate-limited, retry after {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        continue
                     raise HTTPException(response, data)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure()
+                    if last_attempt:
+                        raise
+                    delay = self.retry_policy.backoff(attempt)
+                    _log.debug(f"{method} {url} has failed with {exc!r}, retrying in {delay:.2f} seconds")
+                    await asyncio.sleep(delay)
+        finally:
+            if metrics is not None:
+                metrics.observe("request_seconds", route.path, time.perf_counter() - started)
 
     # Championships
 
@@ -148,29 +324,32 @@ class HTTPClient:
         return await self.request(Route("GET", "/games"), **parameters)
 
     async def get_game_matchmakings(self, game_id: str, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/matchmakings"), **parameters)
+        return await self.request(Route("GET", "/games/{game_id}/matchmakings", game_id=game_id), **parameters)
 
     async def get_game_details(self, game_id: str, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}"), **parameters)
+        return await self.request(Route("GET", "/games/{game_id}", game_id=game_id), **parameters)
 
     async def get_game_parent(self, game_id: str, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/parent"), **parameters)
+        return await self.request(Route("GET", "/games/{game_id}/parent", game_id=game_id), **parameters)
 
     async def get_game_queues(self, game_id: str, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/queues"), **parameters)
+        return await self.request(Route("GET", "/games/{game_id}/queues", game_id=game_id), **parameters)
 
     async def get_game_queue_details(
         self, game_id: str, queue_id: str, **parameters: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/queues/{queue_id}"), **parameters)
+        route = Route("GET", "/games/{game_id}/queues/{queue_id}", game_id=game_id, queue_id=queue_id)
+        return await self.request(route, **parameters)
 
     async def get_game_queue_bans(self, game_id: str, queue_id: str, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/queues/{queue_id}/bans"), **parameters)
+        route = Route("GET", "/games/{game_id}/queues/{queue_id}/bans", game_id=game_id, queue_id=queue_id)
+        return await self.request(route, **parameters)
 
     async def get_game_queue_by_region(
         self, game_id: str, region_id: str, **parameters: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", f"/games/{game_id}/regions/{region_id}/queues"), **parameters)
+        route = Route("GET", "/games/{game_id}/regions/{region_id}/queues", game_id=game_id, region_id=region_id)
+        return await self.request(route, **parameters)
 
     # Hubs
     # Leaderboards
@@ -178,28 +357,31 @@ class HTTPClient:
 
     # Matches
     async def get_match(self, match_id: str) -> Dict[str, Any]:
-        return await self.request(Route("GET", f"/matches/{match_id}"))
+        return await self.request(Route("GET", "/matches/{match_id}", match_id=match_id))
 
     async def get_match_stats(self, match_id: str) -> Dict[str, Any]:
-        return await self.request(Route("GET", f"/matches/{match_id}/stats"))
+        return await self.request(Route("GET", "/matches/{match_id}/stats", match_id=match_id))
 
     # Matchmakings
     async def get_matchmaking(self, matchmaking_id: str) -> Dict[str, Any]:
-        return await self.request(Route("GET", f"/matchmakings/{matchmaking_id}"))
+        return await self.request(Route("GET", "/matchmakings/{matchmaking_id}", matchmaking_id=matchmaking_id))
 
     # Organizers
     async def get_organizer_by_name(self, **parameters: Dict[str, Any]) -> Dict[str, Any]:
         return await self.request(Route("GET", "/organizers"), **parameters)
 
     async def get_organizer_by_id(self, organizer_id: str) -> Dict[str, Any]:
-        return await self.request(Route("GET", f"/organizers/{organizer_id}"))
+        return await self.request(Route("GET", "/organizers/{organizer_id}", organizer_id=organizer_id))
 
     # Players
     async def get_players(self, **parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
         return await self.request(Route("GET", "/players"), **parameters)
 
     async def get_player(self, player_id: str) -> Dict[str, Any]:
-        return await self.request(Route("GET", f"/players/{player_id}"))
+        return await self.request(Route("GET", "/players/{player_id}", player_id=player_id))
+
+    async def get_player_history(self, player_id: str, **parameters: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.request(Route("GET", "/players/{player_id}/history", player_id=player_id), **parameters)
 
     # Rankings
     # Search
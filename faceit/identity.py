@@ -0,0 +1,82 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import weakref
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from .player import Player
+
+__all__ = ("IdentityMap",)
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """Hands out a single instance per entity, e.g. one :class:`Player` per ``player_id``.
+
+    When a response for an entity that is already alive arrives, the existing
+    instance is refreshed in place with the newer data and returned, so every
+    part of a program that holds on to it sees the update and the old payload
+    can be freed. Instances are only referenced weakly, an entity that nobody
+    uses anymore drops out of the map on its own.
+
+    Pass one to :class:`Client` with ``identity_map=faceit.IdentityMap()``.
+    """
+
+    # The models that are kept unique and the payload key that identifies them
+    KEYS: Dict[type, str] = {
+        Player: "player_id",
+    }
+
+    def __init__(self) -> None:
+        self._instances: Dict[type, "weakref.WeakValueDictionary[str, Any]"] = {
+            model: weakref.WeakValueDictionary() for model in self.KEYS
+        }
+
+    def __repr__(self) -> str:
+        return f"<IdentityMap {', '.join(f'{model.__name__}={len(instances)}' for model, instances in self._instances.items())}>"
+
+    def __len__(self) -> int:
+        return sum(len(instances) for instances in self._instances.values())
+
+    def get(self, model: Type[T], key: str) -> Optional[T]:
+        """Return the live instance of ``model`` identified by ``key``, if there is one."""
+        instances = self._instances.get(model)
+        return instances.get(key) if instances is not None else None
+
+    def build(self, model: Callable[..., T], data: Dict[str, Any]) -> T:
+        """Return the instance of ``model`` for ``data``, refreshed with it, or a new one.
+
+        Models that are not kept unique are always built anew.
+        """
+        instances = self._instances.get(model)  # type: ignore
+        key = data.get(self.KEYS[model]) if instances is not None else None  # type: ignore
+        if key is None:
+            return model(data=data)
+        instance = instances.get(key)  # type: ignore
+        if instance is None:
+            instance = instances[key] = model(data=data)  # type: ignore
+        else:
+            instance._update(data)
+        return instance
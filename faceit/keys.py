@@ -0,0 +1,213 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .ratelimit import TokenBucket
+from .utils import _parse_retry_after
+
+__all__ = (
+    "APIKey",
+    "APIKeyPool",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class APIKey:
+    """A single key of an :class:`APIKeyPool` and its usage.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        A masked form of the key that is safe to log, prefixed with its position
+        in the pool so keys with the same last characters stay apart.
+    bucket: Optional[:class:`TokenBucket`]
+        The rate budget of the key, if the pool has one.
+    requests: :class:`int`
+        The number of requests sent with the key.
+    rate_limited: :class:`int`
+        The number of 429 responses the key received.
+    unauthorized: :class:`int`
+        The number of 401 responses the key received.
+    """
+
+    __slots__ = (
+        "name",
+        "header",
+        "bucket",
+        "requests",
+        "rate_limited",
+        "unauthorized",
+        "_quarantined_until",
+    )
+
+    def __init__(self, key: str, bucket: Optional[TokenBucket] = None, *, index: Optional[int] = None) -> None:
+        self.name: str = ("***" if index is None else f"#{index} ***") + key[-4:]
+        self.header: str = f"Bearer {key}"
+        self.bucket: Optional[TokenBucket] = bucket
+        self.requests: int = 0
+        self.rate_limited: int = 0
+        self.unauthorized: int = 0
+        self._quarantined_until: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<APIKey name={self.name!r} requests={self.requests} quarantined_for={self.quarantined_for:.1f}>"
+
+    @property
+    def quarantined_for(self) -> float:
+        """The number of seconds until the key is used again."""
+        return max(self._quarantined_until - time.monotonic(), 0.0)
+
+    @property
+    def utilization(self) -> float:
+        """The share of the key's rate budget that is currently used up, between 0 and 1.
+
+        Always 0 if the pool has no per-key budget.
+        """
+        if self.bucket is None:
+            return 0.0
+        return min(max(1.0 - self.bucket.tokens / self.bucket.rate, 0.0), 1.0)
+
+
+class APIKeyPool:
+    """Spreads requests over several API keys.
+
+    Every request picks the key with the most budget left, keys with the same
+    budget take turns. A key that receives a 429 response is quarantined for as
+    long as ``Retry-After`` asks and a key that receives a 401 response for
+    ``unauthorized_quarantine`` seconds; the request is retried with another key.
+    With a per-key ``limit`` the combined throughput grows with the number of keys.
+
+    Parameters
+    ----------
+    keys: Iterable[:class:`str`]
+        The API keys.
+    limit: Optional[Tuple[:class:`int`, :class:`float`]]
+        ``(rate, per)`` allowed for every single key. ``None`` rotates the keys without
+        a budget.
+    quarantine: :class:`float`
+        Seconds a key is set aside after a 429 response without a ``Retry-After`` header.
+        Defaults to 60.
+    unauthorized_quarantine: :class:`float`
+        Seconds a key is set aside after a 401 response. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        *,
+        limit: Optional[Tuple[int, float]] = None,
+        quarantine: float = 60.0,
+        unauthorized_quarantine: float = 3600.0,
+    ) -> None:
+        self.keys: List[APIKey] = [
+            APIKey(key, TokenBucket(*limit) if limit is not None else None, index=index) for index, key in enumerate(keys)
+        ]
+        if not self.keys:
+            raise ValueError("at least one API key is required")
+        self.quarantine: float = quarantine
+        self.unauthorized_quarantine: float = unauthorized_quarantine
+        self._turn = itertools.count()
+
+    def __repr__(self) -> str:
+        return f"APIKeyPool(keys={len(self.keys)}, available={len(self.available)})"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def available(self) -> List[APIKey]:
+        """The keys that are not quarantined."""
+        return [key for key in self.keys if not key.quarantined_for]
+
+    def _pick(self) -> Optional[APIKey]:
+        available = self.available
+        if not available:
+            return None
+        # Rotate the starting point so keys with equal budget take turns
+        start = next(self._turn) % len(available)
+        available = available[start:] + available[:start]
+        if available[0].bucket is None:
+            return available[0]
+        return max(available, key=lambda key: key.bucket.tokens)  # type: ignore
+
+    async def acquire(self) -> APIKey:
+        """*coroutine*
+        Wait until a key may send a request and return it.
+        """
+        while True:
+            key = self._pick()
+            if key is None:
+                delay = min(key.quarantined_for for key in self.keys)
+                _log.debug(f"Every API key is quarantined, waiting {delay:.3f} seconds")
+                await asyncio.sleep(delay)
+                continue
+
+            delay = key.bucket.reserve() if key.bucket is not None else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # The key may have been quarantined while we were waiting for its budget
+            if key.quarantined_for:
+                continue
+            key.requests += 1
+            return key
+
+    def record(self, key: APIKey, status: int, retry_after: Optional[str] = None) -> float:
+        """Record the response status a key received and quarantine it if needed.
+
+        ``retry_after`` is the raw ``Retry-After`` response header, if any. Returns the
+        number of seconds the key is quarantined for.
+        """
+        if status == 429:
+            key.rate_limited += 1
+            delay = _parse_retry_after(retry_after, self.quarantine)
+        elif status == 401:
+            key.unauthorized += 1
+            delay = self.unauthorized_quarantine
+        else:
+            return 0.0
+        key._quarantined_until = max(key._quarantined_until, time.monotonic() + delay)
+        _log.debug(f"API key {key.name} received {status}, quarantined for {delay:.1f} seconds")
+        return delay
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Return the usage of every key by its name."""
+        total = sum(key.requests for key in self.keys) or 1
+        return {
+            key.name: {
+                "requests": key.requests,
+                "share": key.requests / total,
+                "utilization": key.utilization,
+                "rate_limited": key.rate_limited,
+                "unauthorized": key.unauthorized,
+                "quarantined_for": key.quarantined_for,
+            }
+            for key in self.keys
+        }
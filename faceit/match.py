@@ -25,6 +25,8 @@ SOFTWARE.
 import datetime
 from typing import Any, Dict, List, Optional
 
+from .utils import _intern, _Model
+
 __all__ = (
     "DetailedMatchResult",
     "MatchResult",
@@ -37,10 +39,11 @@ __all__ = (
     "VotingPick",
     "Voting",
     "Match",
+    "MatchHistoryItem",
 )
 
 
-class DetailedMatchResult:
+class DetailedMatchResult(_Model):
     __slots__ = (
         "_asc_score",
         "_winner",
@@ -68,7 +71,7 @@ class DetailedMatchResult:
         return self._factions
 
 
-class MatchResult:
+class MatchResult(_Model):
     __slots__ = (
         "_winner",
         "_score",
@@ -90,7 +93,7 @@ class MatchResult:
         return self._score
 
 
-class SkillLevelRange:
+class SkillLevelRange(_Model):
     __slots__ = (
         "_min",
         "_max",
@@ -112,15 +115,17 @@ class SkillLevelRange:
         return self._max
 
 
-class SkillLevel:
+class SkillLevel(_Model):
     __slots__ = (
         "_average",
         "_range",
+        "_cached_range",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
         self._average = data.get("average")
         self._range = data.get("range")
+        self._cached_range = None
 
     def __repr__(self) -> str:
         return f"SkillLevel(data={{'average': {self._average}, 'range': {self._range}}})"
@@ -131,20 +136,29 @@ class SkillLevel:
 
     @property
     def range(self) -> SkillLevelRange:
-        return SkillLevelRange(data=self._range)
+        if self._cached_range is None:
+            self._cached_range = SkillLevelRange(data=self._range)
+        return self._cached_range
+
 
+class Stats(_Model):
+    _PAYLOAD_KEYS = {
+        "_skill_level": "skillLevel",
+        "_win_probability": "winProbability",
+    }
 
-class Stats:
     __slots__ = (
         "_rating",
         "_skill_level",
         "_win_probability",
+        "_cached_skill_level",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
         self._rating = data.get("rating")
         self._skill_level = data.get("skillLevel")
         self._win_probability = data.get("winProbability")
+        self._cached_skill_level = None
 
     def __repr__(self) -> str:
         return f"Stats(data={{'rating': {self._rating}, 'skillLevel': {self._skill_level}, 'winProbability': {self._win_probability}}})"
@@ -155,14 +169,16 @@ class Stats:
 
     @property
     def skill_level(self) -> SkillLevel:
-        return SkillLevel(data=self._skill_level)
+        if self._cached_skill_level is None:
+            self._cached_skill_level = SkillLevel(data=self._skill_level)
+        return self._cached_skill_level
 
     @property
     def win_probability(self) -> float:
         return self._win_probability
 
 
-class Roster:
+class Roster(_Model):
     __slots__ = (
         "_anticheat_required",
         "_avatar",
@@ -180,7 +196,7 @@ class Roster:
         self._game_player_id = data.get("game_player_id")
         self._game_player_name = data.get("game_player_name")
         self._game_skill_level = data.get("game_skill_level")
-        self._membership = data.get("membership")
+        self._membership = _intern(data.get("membership"))
         self._nickname = data.get("nickname")
         self._player_id = data.get("player_id")
 
@@ -220,7 +236,7 @@ class Roster:
         return self._player_id
 
 
-class Faction:
+class Faction(_Model):
     __slots__ = (
         "_avatar",
         "_faction_id",
@@ -230,6 +246,8 @@ class Faction:
         "_stats",
         "_substituted",
         "_type",
+        "_cached_roster",
+        "_cached_stats",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
@@ -240,7 +258,9 @@ class Faction:
         self._roster = data.get("roster")
         self._stats = data.get("stats")
         self._substituted = data.get("substituted")
-        self._type = data.get("type")
+        self._type = _intern(data.get("type"))
+        self._cached_roster = None
+        self._cached_stats = None
 
     def __repr__(self) -> str:
         return f"Faction(data={{'avatar': '{self._avatar}', 'faction_id': '{self._faction_id}', 'leader': '{self._leader}', 'name': '{self._name}', 'roster': {self._roster}, 'stats': {self._stats}, 'substituted': {self._substituted}, 'type': '{self._type}'}})"
@@ -263,11 +283,15 @@ class Faction:
 
     @property
     def roster(self) -> List[Roster]:
-        return [Roster(data=roster_data) for roster_data in self._roster]
+        if self._cached_roster is None:
+            self._cached_roster = [Roster(data=roster_data) for roster_data in self._roster]
+        return self._cached_roster
 
     @property
     def stats(self) -> Optional[Stats]:
-        return Stats(data=self._stats) if self._stats is not None else None
+        if self._cached_stats is None and self._stats is not None:
+            self._cached_stats = Stats(data=self._stats)
+        return self._cached_stats
 
     @property
     def substituted(self) -> bool:
@@ -278,7 +302,7 @@ class Faction:
         return self._type
 
 
-class VotingEntity:
+class VotingEntity(_Model):
     __slots__ = (
         "_class_name",
         "_game_map_id",
@@ -289,12 +313,12 @@ class VotingEntity:
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
-        self._class_name = data.get("class_name")
-        self._game_map_id = data.get("game_map_id")
+        self._class_name = _intern(data.get("class_name"))
+        self._game_map_id = _intern(data.get("game_map_id"))
         self._guid = data.get("guid")
         self._image_lg = data.get("image_lg")
         self._image_sm = data.get("image_sm")
-        self._name = data.get("name")
+        self._name = _intern(data.get("name"))
 
     def __repr__(self) -> str:
         return f"VotingEntity(data={{'class_name': '{self._class_name}', 'game_map_id': '{self._game_map_id}', 'guid': '{self._guid}', 'image_lg': '{self._image_lg}', 'image_sm': '{self._image_sm}', 'name': '{self._name}'}})"
@@ -324,39 +348,47 @@ class VotingEntity:
         return self._name
 
 
-class VotingPick:
+class VotingPick(_Model):
     __slots__ = (
         "_entities",
         "_pick",
+        "_cached_entities",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
         self._entities = data.get("entities")
         self._pick = data.get("pick")
+        self._cached_entities = None
 
     def __repr__(self) -> str:
         return f"VotingPick(data={{'entities': {self._entities}, 'pick': {self._pick}}})"
 
     @property
     def entities(self) -> List[VotingEntity]:
-        return [VotingEntity(data=entity_data) for entity_data in self._entities]
+        if self._cached_entities is None:
+            self._cached_entities = [VotingEntity(data=entity_data) for entity_data in self._entities]
+        return self._cached_entities
 
     @property
     def pick(self) -> List[str]:
         return self._pick
 
 
-class Voting:
+class Voting(_Model):
     __slots__ = (
         "_voted_entity_types",
         "_location",
         "_map",
+        "_cached_location",
+        "_cached_map",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
         self._voted_entity_types = data.get("voted_entity_types")
         self._location = data.get("location")
         self._map = data.get("map")
+        self._cached_location = None
+        self._cached_map = None
 
     def __repr__(self) -> str:
         return f"Voting(data={{'voted_entity_types': {self._voted_entity_types}, 'location': {self._location}, 'map': {self._map}}})"
@@ -367,14 +399,18 @@ class Voting:
 
     @property
     def location(self) -> VotingPick:
-        return VotingPick(data=self._location)
+        if self._cached_location is None:
+            self._cached_location = VotingPick(data=self._location)
+        return self._cached_location
 
     @property
     def map(self) -> VotingPick:
-        return VotingPick(data=self._map)
+        if self._cached_map is None:
+            self._cached_map = VotingPick(data=self._map)
+        return self._cached_map
 
 
-class Match:
+class Match(_Model):
     __slots__ = (
         "_best_of",
         "_broadcast_start_time",
@@ -402,6 +438,10 @@ class Match:
         "_teams",
         "_version",
         "_voting",
+        "_cached_detailed_results",
+        "_cached_results",
+        "_cached_teams",
+        "_cached_voting",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
@@ -412,25 +452,29 @@ class Match:
         self._chat_room_id = data.get("chat_room_id")
         self._competition_id = data.get("competition_id")
         self._competition_name = data.get("competition_name")
-        self._competition_type = data.get("competition_type")
+        self._competition_type = _intern(data.get("competition_type"))
         self._configured_at = data.get("configured_at")
         self._demo_url = data.get("demo_url")
         self._detailed_results = data.get("detailed_results")
         self._faceit_url = data.get("faceit_url")
         self._finished_at = data.get("finished_at")
-        self._game = data.get("game")
+        self._game = _intern(data.get("game"))
         self._group = data.get("group")
         self._match_id = data.get("match_id")
         self._organizer_id = data.get("organizer_id")
-        self._region = data.get("region")
+        self._region = _intern(data.get("region"))
         self._results = data.get("results")
         self._round = data.get("round")
         self._scheduled_at = data.get("scheduled_at")
         self._started_at = data.get("started_at")
-        self._status = data.get("status")
+        self._status = _intern(data.get("status"))
         self._teams = data.get("teams")
         self._version = data.get("version")
         self._voting = data.get("voting")
+        self._cached_detailed_results = None
+        self._cached_results = None
+        self._cached_teams = None
+        self._cached_voting = None
 
     def __repr__(self) -> str:
         return f"Match(data={{'best_of': {self._best_of}, 'broadcast_start_time': {self._broadcast_start_time}, 'broadcast_start_time_label': {self._broadcast_start_time_label}, 'calculate_elo': {self._calculate_elo}, 'chat_room_id': '{self._chat_room_id}', 'competition_id': '{self._competition_id}', 'competition_name': '{self._competition_name}', 'competition_type': '{self._competition_type}', 'configured_at': {self._configured_at}, 'demo_url': {self._demo_url}, 'detailed_results': {self._detailed_results}, 'faceit_url': '{self._faceit_url}', 'finished_at': {self._finished_at}, 'game': '{self._game}', 'group': {self._group}, 'match_id': '{self._match_id}', 'organizer_id': '{self._organizer_id}', 'region': '{self._region}', 'results': {self._results}, 'round': {self._round}, 'scheduled_at': {self._scheduled_at}, 'started_at': {self._started_at}, 'status': '{self._status}', 'teams': {self._teams}, 'version': {self._version}, 'voting': {self._voting}}})"
@@ -477,7 +521,11 @@ class Match:
 
     @property
     def detailed_results(self) -> List[DetailedMatchResult]:
-        return [DetailedMatchResult(data=detailed_results_data) for detailed_results_data in self._detailed_results]
+        if self._cached_detailed_results is None:
+            self._cached_detailed_results = [
+                DetailedMatchResult(data=detailed_results_data) for detailed_results_data in self._detailed_results
+            ]
+        return self._cached_detailed_results
 
     @property
     def faceit_url(self) -> str:
@@ -509,7 +557,9 @@ class Match:
 
     @property
     def results(self) -> Optional[MatchResult]:
-        return MatchResult(data=self._results) if self._results is not None else None
+        if self._cached_results is None and self._results is not None:
+            self._cached_results = MatchResult(data=self._results)
+        return self._cached_results
 
     @property
     def round(self) -> Optional[int]:
@@ -529,7 +579,9 @@ class Match:
 
     @property
     def teams(self) -> Dict[str, Faction]:
-        return {key: Faction(data=self._teams[key]) for key in self._teams.keys()}
+        if self._cached_teams is None:
+            self._cached_teams = {key: Faction(data=self._teams[key]) for key in self._teams.keys()}
+        return self._cached_teams
 
     @property
     def version(self) -> int:
@@ -537,4 +589,134 @@ class Match:
 
     @property
     def voting(self) -> Voting:
-        return Voting(data=self._voting)
+        if self._cached_voting is None:
+            self._cached_voting = Voting(data=self._voting)
+        return self._cached_voting
+
+
+class MatchHistoryItem(_Model):
+    """A match from the history of a player, see :meth:`Client.get_player_history`.
+
+    This is a summary of the match, the full details are available through
+    :meth:`Client.get_match`.
+    """
+
+    __slots__ = (
+        "_competition_id",
+        "_competition_name",
+        "_competition_type",
+        "_faceit_url",
+        "_finished_at",
+        "_game_id",
+        "_game_mode",
+        "_match_id",
+        "_match_type",
+        "_max_players",
+        "_organizer_id",
+        "_playing_players",
+        "_region",
+        "_results",
+        "_started_at",
+        "_status",
+        "_teams",
+        "_teams_size",
+        "_cached_results",
+    )
+
+    def __init__(self, *, data: Dict[str, Any]) -> None:
+        self._competition_id = data.get("competition_id")
+        self._competition_name = data.get("competition_name")
+        self._competition_type = _intern(data.get("competition_type"))
+        self._faceit_url = data.get("faceit_url")
+        self._finished_at = data.get("finished_at")
+        self._game_id = _intern(data.get("game_id"))
+        self._game_mode = _intern(data.get("game_mode"))
+        self._match_id = data.get("match_id")
+        self._match_type = _intern(data.get("match_type"))
+        self._max_players = data.get("max_players")
+        self._organizer_id = data.get("organizer_id")
+        self._playing_players = data.get("playing_players")
+        self._region = _intern(data.get("region"))
+        self._results = data.get("results")
+        self._started_at = data.get("started_at")
+        self._status = _intern(data.get("status"))
+        self._teams = data.get("teams")
+        self._teams_size = data.get("teams_size")
+        self._cached_results = None
+
+    def __repr__(self) -> str:
+        return f"MatchHistoryItem(data={{'match_id': '{self._match_id}', 'game_id': '{self._game_id}', 'competition_name': '{self._competition_name}', 'status': '{self._status}', 'started_at': {self._started_at}, 'finished_at': {self._finished_at}, 'results': {self._results}}})"
+
+    @property
+    def competition_id(self) -> str:
+        return self._competition_id
+
+    @property
+    def competition_name(self) -> str:
+        return self._competition_name
+
+    @property
+    def competition_type(self) -> str:
+        return self._competition_type
+
+    @property
+    def faceit_url(self) -> str:
+        return self._faceit_url
+
+    @property
+    def finished_at(self) -> Optional[datetime.datetime]:
+        return datetime.datetime.fromtimestamp(self._finished_at) if self._finished_at is not None else None
+
+    @property
+    def game_id(self) -> str:
+        return self._game_id
+
+    @property
+    def game_mode(self) -> str:
+        return self._game_mode
+
+    @property
+    def match_id(self) -> str:
+        return self._match_id
+
+    @property
+    def match_type(self) -> str:
+        return self._match_type
+
+    @property
+    def max_players(self) -> int:
+        return self._max_players
+
+    @property
+    def organizer_id(self) -> str:
+        return self._organizer_id
+
+    @property
+    def playing_players(self) -> List[str]:
+        return self._playing_players
+
+    @property
+    def region(self) -> str:
+        return self._region
+
+    @property
+    def results(self) -> Optional[MatchResult]:
+        if self._cached_results is None and self._results is not None:
+            self._cached_results = MatchResult(data=self._results)
+        return self._cached_results
+
+    @property
+    def started_at(self) -> Optional[datetime.datetime]:
+        return datetime.datetime.fromtimestamp(self._started_at) if self._started_at is not None else None
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def teams(self) -> Dict[str, Dict[str, Any]]:
+        return self._teams
+
+    @property
+    def teams_size(self) -> int:
+        return self._teams_size
@@ -0,0 +1,197 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import bisect
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import aiohttp
+
+__all__ = (
+    "Histogram",
+    "Metrics",
+)
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS: Tuple[float, ...] = tuple(float(256 * 4**i) for i in range(10))
+
+MetricKey = Tuple[str, str]
+Listener = Callable[[str, str, float], None]
+
+
+class Histogram:
+    """A fixed-bucket histogram, compatible with how Prometheus models them.
+
+    Parameters
+    ----------
+    buckets: Sequence[:class:`float`]
+        The sorted upper bounds of the buckets. An implicit ``+Inf`` bucket is added.
+    """
+
+    __slots__ = (
+        "bounds",
+        "counts",
+        "sum",
+        "count",
+    )
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, sum={self.sum})"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @property
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(upper bound, cumulative count)`` pairs, ending with ``+Inf``."""
+        total = 0
+        result = []
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by linear interpolation within its bucket."""
+        if not self.count:
+            return float("nan")
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            if count and seen + count >= rank:
+                if bound == float("inf"):
+                    return lower
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return lower
+
+
+class Metrics:
+    """Per-route timings and counters of an :class:`HTTPClient`.
+
+    Pass an instance as ``metrics`` to :class:`Client` to enable it. Without it
+    the request path only pays for a few ``is None`` checks.
+
+    Histograms, all labelled with the route template, e.g. ``/matches/{match_id}``:
+
+    - ``request_seconds``: the whole call, including retries and waiting.
+    - ``ratelimit_wait_seconds``: time spent waiting for the :class:`RateLimiter`.
+    - ``connection_queue_seconds``: time spent waiting for a free pooled connection.
+    - ``connection_create_seconds``: time spent opening a new connection, including TLS.
+    - ``dns_seconds``: time spent resolving the host.
+    - ``time_to_first_byte_seconds``: from sending the request to receiving the response headers.
+    - ``download_seconds``: time spent reading the response body.
+    - ``decode_seconds``: time spent decoding the JSON body.
+    - ``response_bytes``: the size of the response body.
+    - ``model_seconds``: time spent building models, labelled with the model name instead.
+
+    Counters: ``requests``, ``responses_<status>``, ``retries``, ``cache_hits`` and ``coalesced``.
+
+    Exporters can read everything through :meth:`collect`. Listeners added with
+    :meth:`add_listener` are called with ``(name, label, value)`` for every
+    observation as it happens.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[MetricKey, Histogram] = {}
+        self.counters: Dict[MetricKey, int] = {}
+        self._listeners: List[Listener] = []
+
+    def __repr__(self) -> str:
+        return f"Metrics(histograms={len(self.histograms)}, counters={len(self.counters)})"
+
+    def add_listener(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        self._listeners.remove(listener)
+
+    def observe(self, name: str, label: str, value: float) -> None:
+        key = (name, label)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(SIZE_BUCKETS if name.endswith("_bytes") else LATENCY_BUCKETS)
+        histogram.observe(value)
+        for listener in self._listeners:
+            listener(name, label, value)
+
+    def increment(self, name: str, label: str, amount: int = 1) -> None:
+        key = (name, label)
+        self.counters[key] = self.counters.get(key, 0) + amount
+        for listener in self._listeners:
+            listener(name, label, amount)
+
+    def collect(self) -> Iterator[Tuple[str, str, Any]]:
+        """Yield ``(name, label, value)`` for every metric, where value is an :class:`int` or a :class:`Histogram`."""
+        for (name, label), value in self.counters.items():
+            yield name, label, value
+        for (name, label), histogram in self.histograms.items():
+            yield name, label, histogram
+
+    def clear(self) -> None:
+        self.histograms.clear()
+        self.counters.clear()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return an :class:`aiohttp.TraceConfig` that records the connection level phases.
+
+        The route label is taken from the ``trace_request_ctx`` passed by :class:`HTTPClient`.
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        def phase(name: str, start_attr: str) -> Tuple[Callable[..., Any], Callable[..., Any]]:
+            async def on_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+                setattr(context, start_attr, time.perf_counter())
+
+            async def on_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+                started = getattr(context, start_attr, None)
+                route = getattr(context.trace_request_ctx, "route", None)
+                if started is not None and route is not None:
+                    self.observe(name, route, time.perf_counter() - started)
+
+            return on_start, on_end
+
+        for name, start_signal, end_signal in (
+            ("connection_queue_seconds", trace_config.on_connection_queued_start, trace_config.on_connection_queued_end),
+            ("connection_create_seconds", trace_config.on_connection_create_start, trace_config.on_connection_create_end),
+            ("dns_seconds", trace_config.on_dns_resolvehost_start, trace_config.on_dns_resolvehost_end),
+            ("time_to_first_byte_seconds", trace_config.on_request_headers_sent, trace_config.on_request_end),
+        ):
+            on_start, on_end = phase(name, f"_{name}_started")
+            start_signal.append(on_start)
+            end_signal.append(on_end)
+
+        return trace_config
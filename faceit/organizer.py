@@ -24,10 +24,12 @@ SOFTWARE.
 
 from typing import Any, Dict
 
+from .utils import _Model
+
 __all__ = ("Organizer",)
 
 
-class Organizer:
+class Organizer(_Model):
     """Represents an organizer."""
 
     __slots__ = (
@@ -0,0 +1,190 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Generic, Iterable, List, Mapping, Optional, TypeVar
+
+__all__ = ("Paginator",)
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class Paginator(Generic[T]):
+    """An asynchronous iterator over every item of a paginated endpoint.
+
+    Pages are requested with the ``offset``/``limit`` query parameters. While the
+    items of one page are consumed, the next ``prefetch`` pages are already being
+    fetched, so walking a collection does not wait a full round trip per page.
+    A large ``prefetch`` fans out that many offset windows in parallel, which is
+    the fastest way to snapshot a big collection.
+
+    Iteration stops at the first empty or short page, or after ``total`` items if
+    the size of the collection is known up front. Pages that turn out to lie past
+    the end are cancelled, so at most ``prefetch`` pages are fetched for nothing.
+
+    This is usually not created directly, see e.g. :meth:`Client.iter_games`.
+
+    Parameters
+    ----------
+    fetch: Callable[[Dict[:class:`str`, Any]], Awaitable[Dict[:class:`str`, Any]]]
+        A coroutine function that takes the query parameters and returns the decoded
+        page, whose items are in its ``"items"`` key.
+    transform: Callable[[Dict[:class:`str`, Any]], T]
+        Turns a single item payload into the object that is yielded.
+    offset: :class:`int`
+        The starting item position. Defaults to 0.
+    limit: :class:`int`
+        The number of items per page. Defaults to 20.
+    prefetch: :class:`int`
+        The number of pages fetched ahead of the one being consumed, i.e. at most
+        ``prefetch + 1`` requests are in flight. ``0`` disables prefetching.
+        Defaults to 1.
+    ordered: :class:`bool`
+        Whether items are yielded in offset order. If ``False`` every page is
+        yielded as soon as it arrives, so one slow page does not hold back the
+        others. Defaults to ``True``.
+    total: Optional[:class:`int`]
+        The number of items to fetch starting at ``offset``, if known.
+    params: Optional[Mapping[:class:`str`, Any]]
+        Additional query parameters sent with every page.
+    """
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        transform: Callable[[Dict[str, Any]], T],
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        prefetch: int = 1,
+        ordered: bool = True,
+        total: Optional[int] = None,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        self.fetch: PageFetcher = fetch
+        self.transform: Callable[[Dict[str, Any]], T] = transform
+        self.offset: int = offset
+        self.limit: int = limit
+        self.prefetch: int = prefetch
+        self.ordered: bool = ordered
+        self.total: Optional[int] = total
+        self.params: Dict[str, Any] = dict(params or {})
+
+    def __repr__(self) -> str:
+        return (
+            f"Paginator(offset={self.offset}, limit={self.limit}, prefetch={self.prefetch}, "
+            f"ordered={self.ordered}, total={self.total}, params={self.params!r})"
+        )
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate() if self.ordered else self._iterate_unordered()
+
+    async def flatten(self) -> List[T]:
+        """*coroutine*
+        Return every item as a list.
+        """
+        return [item async for item in self]
+
+    def _fetch_page(self, offset: int, end: Optional[int]) -> "asyncio.Task[Dict[str, Any]]":
+        # The last page of a known total only asks for the items that are still missing
+        limit = self.limit if end is None else min(self.limit, end - offset)
+        params = dict(self.params, offset=offset, limit=limit)
+        return asyncio.ensure_future(self.fetch(params))
+
+    @property
+    def _end(self) -> Optional[int]:
+        return self.offset + self.total if self.total is not None else None
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        pending: Deque[asyncio.Task[Dict[str, Any]]] = deque()
+        offset = next_offset = self.offset
+        end = self._end
+        try:
+            while True:
+                # Keep the current page plus `prefetch` pages in flight
+                while len(pending) <= self.prefetch and (end is None or next_offset < end):
+                    pending.append(self._fetch_page(next_offset, end))
+                    next_offset += self.limit
+                if not pending:
+                    return
+
+                data = await pending.popleft()
+                items = data.get("items") or []
+                # Never yield past the total, even if the API ignores the smaller limit of the last page
+                for item in items[: end - offset] if end is not None else items:
+                    yield self.transform(item)
+
+                if len(items) < self.limit:
+                    return
+                offset += self.limit
+        finally:
+            await _discard(pending)
+
+    async def _iterate_unordered(self) -> AsyncIterator[T]:
+        pending: Dict[asyncio.Task[Dict[str, Any]], int] = {}
+        discarded: List[asyncio.Task[Dict[str, Any]]] = []
+        next_offset = self.offset
+        end = self._end
+        try:
+            while True:
+                while len(pending) <= self.prefetch and (end is None or next_offset < end):
+                    pending[self._fetch_page(next_offset, end)] = next_offset
+                    next_offset += self.limit
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda task: pending.get(task, -1)):
+                    offset = pending.pop(task, None)
+                    if offset is None:
+                        # Finished at the same time as the page that revealed the end
+                        continue
+
+                    items = task.result().get("items") or []
+                    if len(items) < self.limit and (end is None or offset + len(items) < end):
+                        end = offset + len(items)
+                        for other, other_offset in list(pending.items()):
+                            if other_offset >= end:
+                                del pending[other]
+                                discarded.append(other)
+
+                    for item in items[: end - offset] if end is not None else items:
+                        yield self.transform(item)
+        finally:
+            await _discard([*pending, *discarded])
+
+
+async def _discard(tasks: Iterable["asyncio.Task[Any]"]) -> None:
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -22,14 +22,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Dict, Any, List
+from typing import Any, Dict, List
+
+from .utils import _intern, _Model
 
 __all__ = (
     "PlayerGame",
     "Player",
 )
 
-class PlayerGame:
+class PlayerGame(_Model):
     __slots__ = (
         "_region",
         "_game_player_id",
@@ -42,12 +44,12 @@ class PlayerGame:
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
-        self._region = data.get("region")
+        self._region = _intern(data.get("region"))
         self._game_player_id = data.get("game_player_id")
         self._skill_level = data.get("skill_level")
         self._faceit_elo = data.get("faceit_elo")
         self._game_player_name = data.get("game_player_name")
-        self._skill_level_label = data.get("skill_level_label")
+        self._skill_level_label = _intern(data.get("skill_level_label"))
         self._regions = data.get("regions")
         self._game_profile_id = data.get("game_profile_id")
 
@@ -86,7 +88,7 @@ class PlayerGame:
     def game_profile_id(self) -> str:
         return self._game_profile_id
 
-class Player:
+class Player(_Model):
     __slots__ = (
         "_player_id",
         "_nickname",
@@ -107,13 +109,19 @@ class Player:
         "_infractions",
         "_verified",
         "_activated_at",
+        "_cached_games",
+        "__weakref__",
     )
 
     def __init__(self, *, data: Dict[str, Any]) -> None:
+        self._update(data)
+
+    def _update(self, data: Dict[str, Any]) -> None:
+        # Also used by IdentityMap to refresh a shared instance in place
         self._player_id = data.get("player_id")
         self._nickname = data.get("nickname")
         self._avatar = data.get("avatar")
-        self._country = data.get("country")
+        self._country = _intern(data.get("country"))
         self._cover_image = data.get("cover_image")
         self._platforms = data.get("platforms")
         self._games = data.get("games")
@@ -124,11 +132,12 @@ class Player:
         self._steam_nickname = data.get("steam_nickname")
         self._memberships = data.get("memberships")
         self._faceit_url = data.get("faceit_url")
-        self._membership_type = data.get("membership_type")
+        self._membership_type = _intern(data.get("membership_type"))
         self._cover_featured_image = data.get("cover_featured_image")
         self._infractions = data.get("infractions")
         self._verified = data.get("verified", False)
         self._activated_at = data.get("activated_at")
+        self._cached_games = None
 
     def __repr__(self) -> str:
         return f"Player(data={{'player_id': '{self._player_id}', 'nickname': '{self._nickname}', 'avatar': '{self._avatar}', 'country': '{self._country}', 'cover_image': '{self._cover_image}', 'platforms': {self._platforms}, 'games': {self._games}, 'settings': {self._settings}, 'friends_ids': {self._friends_ids}, 'new_steam_id': '{self._new_steam_id}', 'steam_id_64': '{self._steam_id_64}', 'steam_nickname': '{self._steam_nickname}', 'memberships': {self._memberships}, 'faceit_url': '{self._faceit_url}', 'membership_type': '{self._membership_type}', 'cover_featured_image': '{self._cover_featured_image}', 'infractions': {self._infractions}, 'verified': {self._verified}, 'activated_at': '{self._activated_at}'}})"
@@ -159,7 +168,9 @@ class Player:
 
     @property
     def games(self) -> Dict[str, PlayerGame]:
-        return {key: PlayerGame(data=self._games[key]) for key in self._games.keys()}
+        if self._cached_games is None:
+            self._cached_games = {key: PlayerGame(data=self._games[key]) for key in self._games.keys()}
+        return self._cached_games
 
     @property
     def settings(self) -> Dict[str, str]:
@@ -0,0 +1,288 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.context
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from .utils import _parse_retry_after
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+    "SharedTokenBucket",
+    "SharedRateLimiter",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """A token bucket that allows ``rate`` requests every ``per`` seconds.
+
+    Tokens are reserved up front, so the bucket never needs a lock: every caller
+    takes a token immediately and is told how long it has to wait before the
+    token becomes valid. Callers under budget do not wait at all.
+
+    Parameters
+    ----------
+    rate: :class:`int`
+        The number of requests allowed per window. This is also the burst size.
+    per: :class:`float`
+        The length of the window in seconds.
+    """
+
+    __slots__ = (
+        "_rate",
+        "_per",
+        "_tokens",
+        "_last",
+    )
+
+    def __init__(self, rate: int, per: float) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate and per must be positive")
+        self._rate = rate
+        self._per = per
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self._rate}, per={self._per})"
+
+    @property
+    def rate(self) -> int:
+        return self._rate
+
+    @property
+    def per(self) -> float:
+        return self._per
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available. Negative if callers are queued."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self._rate, self._tokens + elapsed * self._rate / self._per)
+            self._last = now
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it."""
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens * self._per / self._rate
+
+
+class RateLimiter:
+    """Client side rate limiting for :class:`HTTPClient`.
+
+    Requests are only delayed when a bucket runs out of tokens; there is no limit on
+    the number of requests in flight while under budget.
+
+    Parameters
+    ----------
+    global_limit: Optional[Tuple[:class:`int`, :class:`float`]]
+        ``(rate, per)`` shared by every request. ``None`` disables the global bucket.
+    route_limits: Optional[Mapping[:class:`str`, Tuple[:class:`int`, :class:`float`]]]
+        ``(rate, per)`` for a route template, e.g. ``{"/matches/{match_id}": (10, 1.0)}``.
+        Each template gets a single bucket shared by all of its URLs.
+    default_retry_after: :class:`float`
+        Seconds to back off after a 429 response without a ``Retry-After`` header.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_limit: Optional[Tuple[int, float]] = None,
+        route_limits: Optional[Mapping[str, Tuple[int, float]]] = None,
+        default_retry_after: float = 60.0,
+    ) -> None:
+        self.global_bucket: Optional[TokenBucket] = TokenBucket(*global_limit) if global_limit is not None else None
+        self.route_buckets: Dict[str, TokenBucket] = {
+            path: TokenBucket(*limit) for path, limit in (route_limits or {}).items()
+        }
+        self.default_retry_after: float = default_retry_after
+        self._blocked_until: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(global_bucket={self.global_bucket!r}, route_buckets={self.route_buckets!r})"
+
+    @property
+    def blocked_for(self) -> float:
+        """The number of seconds until requests are allowed again after a 429 response."""
+        return max(self._blocked_until - time.monotonic(), 0.0)
+
+    def delay_for(self, path: str) -> float:
+        """Reserve a request on ``path`` and return the number of seconds to wait before sending it."""
+        delay = self.blocked_for
+        if self.global_bucket is not None:
+            delay = max(delay, self.global_bucket.reserve())
+        bucket = self.route_buckets.get(path)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        return delay
+
+    async def acquire(self, path: str) -> float:
+        """*coroutine*
+        Wait until a request on the route template ``path`` may be sent.
+
+        Returns the number of seconds spent waiting.
+        """
+        delay = self.delay_for(path)
+        waited = 0.0
+        while delay > 0:
+            _log.debug(f"{path} is rate-limited, waiting {delay:.3f} seconds")
+            await asyncio.sleep(delay)
+            waited += delay
+            # A 429 may have arrived while we were sleeping
+            delay = self.blocked_for
+        return waited
+
+    def block(self, retry_after: Optional[str]) -> float:
+        """Hold back every request after the API answered with 429.
+
+        ``retry_after`` is the raw ``Retry-After`` response header, either a number
+        of seconds or an HTTP date. Returns the number of seconds requests are held back.
+        """
+        delay = _parse_retry_after(retry_after, self.default_retry_after)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        return delay
+
+
+class SharedTokenBucket(TokenBucket):
+    """A :class:`TokenBucket` whose tokens live in shared memory, so that several
+    processes draw from the same budget.
+
+    The bucket has to be handed to the other processes when they are started,
+    e.g. as an argument of :class:`multiprocessing.Process`.
+
+    Parameters
+    ----------
+    rate: :class:`int`
+        The number of requests allowed per window across all processes.
+    per: :class:`float`
+        The length of the window in seconds.
+    context: Optional[:class:`multiprocessing.context.BaseContext`]
+        The multiprocessing context the processes are started with. Defaults to the
+        default context.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, rate: int, per: float, *, context: Optional[multiprocessing.context.BaseContext] = None) -> None:
+        super().__init__(rate, per)
+        context = context or multiprocessing.get_context()
+        # time.monotonic() is system-wide, so the timestamp can be shared as well
+        self._state = context.Array("d", [self._tokens, self._last])
+
+    def __repr__(self) -> str:
+        return f"SharedTokenBucket(rate={self._rate}, per={self._per})"
+
+    def _take(self, count: int) -> float:
+        state = self._state
+        with state.get_lock():
+            tokens, last = state[0], state[1]
+            now = time.monotonic()
+            if now > last:
+                tokens = min(self._rate, tokens + (now - last) * self._rate / self._per)
+                last = now
+            tokens -= count
+            state[0], state[1] = tokens, last
+        return tokens
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available. Negative if callers are queued."""
+        return self._take(0)
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it."""
+        tokens = self._take(1)
+        if tokens >= 0:
+            return 0.0
+        return -tokens * self._per / self._rate
+
+
+class SharedRateLimiter(RateLimiter):
+    """A :class:`RateLimiter` shared by several processes.
+
+    Every bucket is a :class:`SharedTokenBucket` and a 429 response received by one
+    process holds back the requests of all of them. Like the buckets, the limiter
+    has to be handed to the other processes when they are started.
+
+    Parameters
+    ----------
+    global_limit: Optional[Tuple[:class:`int`, :class:`float`]]
+        ``(rate, per)`` shared by every request of every process.
+    route_limits: Optional[Mapping[:class:`str`, Tuple[:class:`int`, :class:`float`]]]
+        ``(rate, per)`` for a route template, shared by every process.
+    default_retry_after: :class:`float`
+        Seconds to back off after a 429 response without a ``Retry-After`` header.
+    context: Optional[:class:`multiprocessing.context.BaseContext`]
+        The multiprocessing context the processes are started with.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_limit: Optional[Tuple[int, float]] = None,
+        route_limits: Optional[Mapping[str, Tuple[int, float]]] = None,
+        default_retry_after: float = 60.0,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        super().__init__(default_retry_after=default_retry_after)
+        context = context or multiprocessing.get_context()
+        if global_limit is not None:
+            self.global_bucket = SharedTokenBucket(*global_limit, context=context)
+        self.route_buckets = {
+            path: SharedTokenBucket(*limit, context=context) for path, limit in (route_limits or {}).items()
+        }
+        self._shared_blocked_until = context.Value("d", 0.0)
+
+    @property
+    def blocked_for(self) -> float:
+        """The number of seconds until requests are allowed again after a 429 response."""
+        return max(self._shared_blocked_until.value - time.monotonic(), 0.0)
+
+    def block(self, retry_after: Optional[str]) -> float:
+        """Hold back every request of every process after the API answered with 429.
+
+        ``retry_after`` is the raw ``Retry-After`` response header, either a number
+        of seconds or an HTTP date. Returns the number of seconds requests are held back.
+        """
+        delay = _parse_retry_after(retry_after, self.default_retry_after)
+        blocked_until = self._shared_blocked_until
+        with blocked_until.get_lock():
+            blocked_until.value = max(blocked_until.value, time.monotonic() + delay)
+        return delay
@@ -0,0 +1,160 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import random
+import time
+from typing import FrozenSet, Iterable, Optional
+
+from .errors import CircuitBreakerOpen
+from .utils import _parse_retry_after
+
+__all__ = (
+    "RetryPolicy",
+    "CircuitBreaker",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Server errors and connection failures are retried with exponential backoff and
+    full jitter, i.e. a random delay between 0 and ``base_delay * 2 ** retry``
+    capped at ``max_delay``. A ``Retry-After`` header sent by the server takes
+    precedence when it asks for a longer wait, even beyond ``max_delay``.
+
+    Parameters
+    ----------
+    max_attempts: :class:`int`
+        The total number of attempts per request, including the first one.
+        ``1`` disables retries. Defaults to 4.
+    base_delay: :class:`float`
+        The backoff of the first retry in seconds. Defaults to 0.5.
+    max_delay: :class:`float`
+        The upper bound of a single backoff in seconds. Does not apply to ``Retry-After``.
+        Defaults to 30.
+    retry_statuses: Iterable[:class:`int`]
+        The status codes that are retried. Defaults to 500, 502, 503 and 504.
+        429 is always retried and handled by the :class:`RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, max_delay={self.max_delay})"
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Return the number of seconds to wait after the failed attempt ``attempt`` (starting at 0).
+
+        ``retry_after`` is the raw ``Retry-After`` response header, if any.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        if retry_after is not None:
+            delay = max(delay, _parse_retry_after(retry_after, 0.0))
+        return delay
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API is down.
+
+    After ``failure_threshold`` consecutive server errors or connection failures the
+    breaker opens and every request raises :exc:`CircuitBreakerOpen` without being
+    sent. Once ``reset_timeout`` seconds have passed a single probe request is let
+    through; if it succeeds the breaker closes again, otherwise it stays open for
+    another ``reset_timeout``.
+
+    Parameters
+    ----------
+    failure_threshold: :class:`int`
+        The number of consecutive failures that open the breaker. Defaults to 5.
+    reset_timeout: :class:`float`
+        The number of seconds the breaker stays open. Defaults to 30.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.failures: int = 0
+        self._opened_at: float = 0.0
+        self._probe_started_at: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(state={self.state!r}, failures={self.failures})"
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.failure_threshold:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def check(self) -> None:
+        """Raise :exc:`CircuitBreakerOpen` if a request must not be sent right now."""
+        if self.failures < self.failure_threshold:
+            return
+        now = time.monotonic()
+        remaining = self._opened_at + self.reset_timeout - now
+        if remaining > 0:
+            raise CircuitBreakerOpen(remaining)
+        # Half-open: let one probe through. A probe that never reported back is replaced after reset_timeout.
+        if self._probe_started_at is not None and now - self._probe_started_at < self.reset_timeout:
+            raise CircuitBreakerOpen(self._probe_started_at + self.reset_timeout - now)
+        self._probe_started_at = now
+
+    def record_success(self) -> None:
+        if self.failures >= self.failure_threshold:
+            _log.info("The FACEIT API is responding again, closing the circuit breaker")
+        self.failures = 0
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_started_at = None
+        if self.failures >= self.failure_threshold:
+            if self.failures == self.failure_threshold:
+                _log.warning(f"{self.failures} requests in a row failed, opening the circuit breaker")
+            self._opened_at = time.monotonic()
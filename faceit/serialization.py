@@ -0,0 +1,162 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import zlib
+from typing import Dict, List, Sequence, Type, Union
+
+try:
+    import msgpack  # type: ignore
+except ModuleNotFoundError:
+    HAS_MSGPACK = False
+else:
+    HAS_MSGPACK = True
+
+from .game import Game, GameAssets
+from .match import (
+    DetailedMatchResult,
+    Faction,
+    Match,
+    MatchHistoryItem,
+    MatchResult,
+    Roster,
+    SkillLevel,
+    SkillLevelRange,
+    Stats,
+    Voting,
+    VotingEntity,
+    VotingPick,
+)
+from .organizer import Organizer
+from .player import Player, PlayerGame
+from .stats import MatchStats, RoundStats
+from .utils import _from_json, _Model, _to_json
+
+__all__ = (
+    "encode_models",
+    "decode_models",
+)
+
+
+FORMAT_VERSION = 1
+
+# The first byte of an encoded value tells which codec wrote it
+_MSGPACK = b"m"
+_JSON = b"j"
+
+_MODELS: Dict[str, Type[_Model]] = {
+    model.__name__: model
+    for model in (
+        DetailedMatchResult,
+        Faction,
+        Game,
+        GameAssets,
+        Match,
+        MatchHistoryItem,
+        MatchResult,
+        MatchStats,
+        Organizer,
+        Player,
+        PlayerGame,
+        Roster,
+        RoundStats,
+        SkillLevel,
+        SkillLevelRange,
+        Stats,
+        Voting,
+        VotingEntity,
+        VotingPick,
+    )
+}
+
+
+def _fingerprint(model: Type[_Model]) -> int:
+    # Changes whenever fields are added, removed or reordered, so stale encodings are refused
+    return zlib.crc32(",".join(model._slots()[0]).encode())
+
+
+def encode_models(value: Union[_Model, Sequence[_Model]]) -> bytes:
+    """Encode a model, or a sequence of models of the same type, to bytes.
+
+    Only the payload fields are stored, by position, so the encoding is much more
+    compact than the JSON payload. msgpack is used if it is installed, JSON
+    otherwise; :func:`decode_models` reads both. The encoding round-trips: the decoded
+    models hold equal fields.
+
+    :class:`TeamMatchStats` and :class:`PlayerMatchStats` are views into the table
+    of their :class:`RoundStats` and can't be encoded, encode the round or match instead.
+
+    Raises
+    ------
+    TypeError
+        ``value`` is not a model or the models are not all of the same type.
+    """
+    many = not isinstance(value, _Model)
+    if many and not isinstance(value, (list, tuple)):
+        raise TypeError(f"Can't encode {type(value).__name__}")
+    models: Sequence[_Model] = value if many else [value]  # type: ignore
+    if not models:
+        raise TypeError("Can't encode an empty sequence, the model type is unknown")
+    model = type(models[0])
+    if model.__name__ not in _MODELS:
+        raise TypeError(f"Can't encode {model.__name__}")
+    if any(type(item) is not model for item in models):
+        raise TypeError(f"Every model must be a {model.__name__}")
+
+    message = [FORMAT_VERSION, model.__name__, _fingerprint(model), many, [item.__getstate__() for item in models]]
+    if HAS_MSGPACK:
+        return _MSGPACK + msgpack.packb(message, use_bin_type=True)
+    return _JSON + _to_json(message).encode("utf-8")
+
+
+def decode_models(data: bytes) -> Union[_Model, List[_Model]]:
+    """Decode what :func:`encode_models` encoded.
+
+    Returns a single model or a list of models, like it was encoded.
+
+    Raises
+    ------
+    ValueError
+        The data was not encoded by a compatible version of :func:`encode_models`.
+    """
+    codec, body = data[:1], data[1:]
+    if codec == _MSGPACK:
+        if not HAS_MSGPACK:
+            raise ValueError("The data was encoded with msgpack, which is not installed")
+        message = msgpack.unpackb(body, raw=False)
+    elif codec == _JSON:
+        message = _from_json(body)
+    else:
+        raise ValueError("The data was not encoded by encode_models")
+
+    version, name, fingerprint, many, states = message
+    model = _MODELS.get(name)
+    if version != FORMAT_VERSION or model is None or fingerprint != _fingerprint(model):
+        raise ValueError(f"The data holds a {name} encoded by an incompatible version")
+
+    models = []
+    for state in states:
+        item = model.__new__(model)
+        item.__setstate__(state)
+        models.append(item)
+    return models if many else models[0]
@@ -0,0 +1,450 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+from .utils import _Model
+
+__all__ = (
+    "PlayerStatsTable",
+    "PlayerMatchStats",
+    "TeamMatchStats",
+    "RoundStats",
+    "MatchStats",
+)
+
+
+# Attribute names of the player statistics the API sends as strings
+STAT_NAMES: Dict[str, str] = {
+    "kills": "Kills",
+    "deaths": "Deaths",
+    "assists": "Assists",
+    "headshots": "Headshots",
+    "headshots_percentage": "Headshots %",
+    "kd_ratio": "K/D Ratio",
+    "kr_ratio": "K/R Ratio",
+    "adr": "ADR",
+    "damage": "Damage",
+    "mvps": "MVPs",
+    "double_kills": "Double Kills",
+    "triple_kills": "Triple Kills",
+    "quadro_kills": "Quadro Kills",
+    "penta_kills": "Penta Kills",
+    "result": "Result",
+}
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class PlayerStatsTable:
+    """Per-player statistics of one or more rounds stored column by column.
+
+    Every statistic is converted from its string form once and kept in an
+    ``array('d')`` with one entry per player row, so aggregating, e.g. the kills
+    over thousands of matches, works on plain floats. Statistics a player does
+    not have are NaN.
+
+    Statistics can be looked up by their API name (``"K/D Ratio"``) or by the
+    attribute name used on :class:`PlayerMatchStats` (``"kd_ratio"``).
+    """
+
+    __slots__ = (
+        "_player_ids",
+        "_nicknames",
+        "_columns",
+    )
+
+    def __init__(self) -> None:
+        self._player_ids: List[str] = []
+        self._nicknames: List[str] = []
+        self._columns: Dict[str, array] = {}
+
+    def __repr__(self) -> str:
+        return f"PlayerStatsTable(rows={len(self._player_ids)}, columns={list(self._columns)})"
+
+    def __len__(self) -> int:
+        return len(self._player_ids)
+
+    @classmethod
+    def from_players(cls, players: Iterable[Dict[str, Any]]) -> "PlayerStatsTable":
+        """Build a table from the ``players`` payloads of a round's teams."""
+        table = cls()
+        for player in players:
+            table.append(player)
+        return table
+
+    @classmethod
+    def concat(cls, tables: Iterable["PlayerStatsTable"]) -> "PlayerStatsTable":
+        """Stack several tables, e.g. of many matches, into one."""
+        result = cls()
+        for table in tables:
+            rows = len(result)
+            for name in table._columns:
+                if name not in result._columns:
+                    result._columns[name] = array("d", [math.nan]) * rows
+            for name, column in result._columns.items():
+                other = table._columns.get(name)
+                column.extend(other if other is not None else array("d", [math.nan]) * len(table))
+            result._player_ids.extend(table._player_ids)
+            result._nicknames.extend(table._nicknames)
+        return result
+
+    def append(self, player: Dict[str, Any]) -> None:
+        row = len(self._player_ids)
+        stats = player.get("player_stats") or {}
+        for name in stats:
+            if name not in self._columns:
+                self._columns[name] = array("d", [math.nan]) * row
+        for name, column in self._columns.items():
+            column.append(_to_float(stats.get(name)))
+        self._player_ids.append(player.get("player_id"))
+        self._nicknames.append(player.get("nickname"))
+
+    @property
+    def player_ids(self) -> List[str]:
+        return self._player_ids
+
+    @property
+    def nicknames(self) -> List[str]:
+        return self._nicknames
+
+    @property
+    def names(self) -> List[str]:
+        """The API names of the statistics in this table."""
+        return list(self._columns)
+
+    def column(self, name: str) -> array:
+        """Return the values of a statistic for every row."""
+        column = self._columns.get(STAT_NAMES.get(name, name))
+        if column is None:
+            return array("d", [math.nan]) * len(self)
+        return column
+
+    def get(self, row: int, name: str) -> float:
+        column = self._columns.get(STAT_NAMES.get(name, name))
+        return column[row] if column is not None else math.nan
+
+    def total(self, name: str) -> float:
+        """Return the sum of a statistic over every row, ignoring missing values."""
+        return math.fsum(value for value in self.column(name) if value == value)
+
+
+class PlayerMatchStats:
+    """The statistics of a player in a single round, backed by a :class:`PlayerStatsTable` row."""
+
+    __slots__ = (
+        "_table",
+        "_row",
+    )
+
+    def __init__(self, *, table: PlayerStatsTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __repr__(self) -> str:
+        return f"PlayerMatchStats(player_id='{self.player_id}', nickname='{self.nickname}', stats={self.stats})"
+
+    @property
+    def player_id(self) -> str:
+        return self._table._player_ids[self._row]
+
+    @property
+    def nickname(self) -> str:
+        return self._table._nicknames[self._row]
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Every statistic of the player by its API name."""
+        return {name: self._table.get(self._row, name) for name in self._table._columns}
+
+    def get(self, name: str) -> float:
+        """Return a statistic by its API or attribute name, NaN if it is missing."""
+        return self._table.get(self._row, name)
+
+    def _count(self, name: str) -> Optional[int]:
+        value = self._table.get(self._row, name)
+        return int(value) if value == value else None
+
+    @property
+    def kills(self) -> Optional[int]:
+        return self._count("Kills")
+
+    @property
+    def deaths(self) -> Optional[int]:
+        return self._count("Deaths")
+
+    @property
+    def assists(self) -> Optional[int]:
+        return self._count("Assists")
+
+    @property
+    def headshots(self) -> Optional[int]:
+        return self._count("Headshots")
+
+    @property
+    def headshots_percentage(self) -> float:
+        return self._table.get(self._row, "Headshots %")
+
+    @property
+    def kd_ratio(self) -> float:
+        return self._table.get(self._row, "K/D Ratio")
+
+    @property
+    def kr_ratio(self) -> float:
+        return self._table.get(self._row, "K/R Ratio")
+
+    @property
+    def adr(self) -> float:
+        return self._table.get(self._row, "ADR")
+
+    @property
+    def damage(self) -> Optional[int]:
+        return self._count("Damage")
+
+    @property
+    def mvps(self) -> Optional[int]:
+        return self._count("MVPs")
+
+    @property
+    def double_kills(self) -> Optional[int]:
+        return self._count("Double Kills")
+
+    @property
+    def triple_kills(self) -> Optional[int]:
+        return self._count("Triple Kills")
+
+    @property
+    def quadro_kills(self) -> Optional[int]:
+        return self._count("Quadro Kills")
+
+    @property
+    def penta_kills(self) -> Optional[int]:
+        return self._count("Penta Kills")
+
+    @property
+    def result(self) -> Optional[int]:
+        return self._count("Result")
+
+    @property
+    def won(self) -> bool:
+        return self._table.get(self._row, "Result") == 1
+
+
+class TeamMatchStats:
+    __slots__ = (
+        "_team_id",
+        "_premade",
+        "_team_stats",
+        "_players",
+        "_table",
+        "_first_row",
+        "_cached_players",
+    )
+
+    def __init__(self, *, data: Dict[str, Any], table: PlayerStatsTable, first_row: int) -> None:
+        self._team_id = data.get("team_id")
+        self._premade = data.get("premade")
+        self._team_stats = data.get("team_stats") or {}
+        self._players = data.get("players") or []
+        self._table = table
+        self._first_row = first_row
+        self._cached_players = None
+
+    def __repr__(self) -> str:
+        return f"TeamMatchStats(data={{'team_id': '{self._team_id}', 'premade': {self._premade}, 'team_stats': {self._team_stats}}})"
+
+    @property
+    def team_id(self) -> str:
+        return self._team_id
+
+    @property
+    def premade(self) -> bool:
+        return self._premade
+
+    @property
+    def name(self) -> str:
+        return self._team_stats.get("Team")
+
+    @property
+    def won(self) -> bool:
+        return self._team_stats.get("Team Win") == "1"
+
+    @property
+    def final_score(self) -> int:
+        return int(self._team_stats.get("Final Score", 0))
+
+    @property
+    def team_stats(self) -> Dict[str, str]:
+        return self._team_stats
+
+    @property
+    def players(self) -> List[PlayerMatchStats]:
+        if self._cached_players is None:
+            self._cached_players = [
+                PlayerMatchStats(table=self._table, row=self._first_row + offset) for offset in range(len(self._players))
+            ]
+        return self._cached_players
+
+
+class RoundStats(_Model):
+    """The statistics of a single map of a match."""
+
+    __slots__ = (
+        "_best_of",
+        "_game_id",
+        "_game_mode",
+        "_match_id",
+        "_match_round",
+        "_played",
+        "_round_stats",
+        "_teams",
+        "_cached_table",
+        "_cached_teams",
+    )
+
+    def __init__(self, *, data: Dict[str, Any]) -> None:
+        self._best_of = data.get("best_of")
+        self._game_id = data.get("game_id")
+        self._game_mode = data.get("game_mode")
+        self._match_id = data.get("match_id")
+        self._match_round = data.get("match_round")
+        self._played = data.get("played")
+        self._round_stats = data.get("round_stats") or {}
+        self._teams = data.get("teams") or []
+        self._cached_table = None
+        self._cached_teams = None
+
+    def __repr__(self) -> str:
+        return f"RoundStats(data={{'best_of': '{self._best_of}', 'game_id': '{self._game_id}', 'game_mode': '{self._game_mode}', 'match_id': '{self._match_id}', 'match_round': '{self._match_round}', 'played': '{self._played}', 'round_stats': {self._round_stats}}})"
+
+    @property
+    def best_of(self) -> int:
+        return int(self._best_of)
+
+    @property
+    def game_id(self) -> str:
+        return self._game_id
+
+    @property
+    def game_mode(self) -> str:
+        return self._game_mode
+
+    @property
+    def match_id(self) -> str:
+        return self._match_id
+
+    @property
+    def match_round(self) -> int:
+        return int(self._match_round)
+
+    @property
+    def played(self) -> bool:
+        return self._played == "1"
+
+    @property
+    def map(self) -> str:
+        return self._round_stats.get("Map")
+
+    @property
+    def score(self) -> str:
+        return self._round_stats.get("Score")
+
+    @property
+    def rounds(self) -> int:
+        return int(self._round_stats.get("Rounds", 0))
+
+    @property
+    def winner(self) -> str:
+        """The ``team_id`` of the winning team."""
+        return self._round_stats.get("Winner")
+
+    @property
+    def region(self) -> str:
+        return self._round_stats.get("Region")
+
+    @property
+    def players(self) -> PlayerStatsTable:
+        """The statistics of every player of both teams, built on first access."""
+        if self._cached_table is None:
+            self._cached_table = PlayerStatsTable.from_players(
+                player for team in self._teams for player in team.get("players") or ()
+            )
+        return self._cached_table
+
+    @property
+    def teams(self) -> List[TeamMatchStats]:
+        if self._cached_teams is None:
+            table = self.players
+            teams = []
+            first_row = 0
+            for team_data in self._teams:
+                teams.append(TeamMatchStats(data=team_data, table=table, first_row=first_row))
+                first_row += len(team_data.get("players") or ())
+            self._cached_teams = teams
+        return self._cached_teams
+
+
+class MatchStats(_Model):
+    """Represents the statistics of a match.
+
+    Nothing is parsed up front: rounds, teams and the per-player statistics are
+    only built when they are first accessed, and are rebuilt after unpickling.
+    """
+
+    __slots__ = (
+        "_rounds",
+        "_cached_rounds",
+    )
+
+    def __init__(self, *, data: Dict[str, Any]) -> None:
+        self._rounds = data.get("rounds") or []
+        self._cached_rounds = None
+
+    def __repr__(self) -> str:
+        return f"MatchStats(data={{'rounds': {self._rounds}}})"
+
+    @property
+    def rounds(self) -> List[RoundStats]:
+        if self._cached_rounds is None:
+            self._cached_rounds = [RoundStats(data=round_data) for round_data in self._rounds]
+        return self._cached_rounds
+
+    @property
+    def match_id(self) -> Optional[str]:
+        return self._rounds[0].get("match_id") if self._rounds else None
+
+    @property
+    def players(self) -> PlayerStatsTable:
+        """The player statistics of every round stacked into one table."""
+        rounds = self.rounds
+        if len(rounds) == 1:
+            return rounds[0].players
+        return PlayerStatsTable.concat(round_stats.players for round_stats in rounds)
@@ -0,0 +1,309 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import io
+import logging
+import os
+import time
+import zlib
+from collections import deque
+from typing import Any, BinaryIO, Deque, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .utils import _from_json, _to_json
+
+__all__ = (
+    "TransportResponse",
+    "Transport",
+    "AiohttpTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+)
+
+
+_log = logging.getLogger(__name__)
+
+# Request headers that are never written to a recording
+_SECRET_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie"})
+
+
+def _exchange_key(method: str, url: str, params: Optional[Mapping[str, Any]]) -> str:
+    key = f"{method} {url}"
+    if params:
+        key += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+    return key
+
+
+class TransportResponse:
+    """A fully downloaded HTTP response as returned by a :class:`Transport`.
+
+    Attributes
+    ----------
+    status: :class:`int`
+        The status code.
+    reason: :class:`str`
+        The reason phrase, e.g. ``Not Found``.
+    headers: Mapping[:class:`str`, :class:`str`]
+        The case-insensitive response headers.
+    body: :class:`bytes`
+        The raw response body.
+    elapsed: :class:`float`
+        The number of seconds from sending the request until the body was read.
+    download: :class:`float`
+        The part of ``elapsed`` spent reading the body after the headers arrived.
+    """
+
+    __slots__ = (
+        "status",
+        "reason",
+        "headers",
+        "body",
+        "elapsed",
+        "download",
+    )
+
+    def __init__(
+        self,
+        *,
+        status: int,
+        reason: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        elapsed: float = 0.0,
+        download: float = 0.0,
+    ) -> None:
+        self.status: int = status
+        self.reason: str = reason
+        self.headers: Mapping[str, str] = headers
+        self.body: bytes = body
+        self.elapsed: float = elapsed
+        self.download: float = download
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        # The live header proxies can't be pickled, a plain copy keeps them case-insensitive
+        return (self.status, self.reason, CIMultiDict(self.headers), self.body, self.elapsed, self.download)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self.status, self.reason, self.headers, self.body, self.elapsed, self.download = state
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse status={self.status} size={len(self.body)} elapsed={self.elapsed:.3f}>"
+
+
+class Transport:
+    """The interface the HTTP client sends its requests through.
+
+    Subclasses implement :meth:`request`, which receives the client's
+    :class:`aiohttp.ClientSession` along with the method, URL and the keyword
+    arguments that would be passed to :meth:`aiohttp.ClientSession.request`.
+    """
+
+    async def request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any) -> TransportResponse:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release any resources held by the transport."""
+        pass
+
+
+class AiohttpTransport(Transport):
+    """Sends requests over the network with aiohttp. This is the default transport."""
+
+    async def request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any) -> TransportResponse:
+        started = time.perf_counter()
+        async with session.request(method, url, **kwargs) as response:
+            download_started = time.perf_counter()
+            body = await response.read()
+            finished = time.perf_counter()
+        return TransportResponse(
+            status=response.status,
+            reason=response.reason or "",
+            headers=response.headers,
+            body=body,
+            elapsed=finished - started,
+            download=finished - download_started,
+        )
+
+
+class RecordingTransport(Transport):
+    """Records every request and response sent through another transport to a file.
+
+    A recording is a sequence of records, each a single JSON line describing the
+    exchange (method, URL, query parameters, request and response headers, status
+    and timing) directly followed by the raw response body. Bodies are compressed
+    with zlib one by one, so the file can be written and replayed as a stream
+    without ever holding more than one response in memory.
+
+    ``Authorization``, ``Proxy-Authorization`` and ``Cookie`` request headers are
+    never recorded.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The file to record to.
+    transport: Optional[:class:`Transport`]
+        The transport that actually sends the requests. Defaults to :class:`AiohttpTransport`.
+    compress: :class:`bool`
+        Whether response bodies are compressed. Defaults to ``True``.
+    append: :class:`bool`
+        Whether to add to an existing recording instead of replacing it. Defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        transport: Optional[Transport] = None,
+        compress: bool = True,
+        append: bool = False,
+    ) -> None:
+        self.transport: Transport = transport if transport is not None else AiohttpTransport()
+        self.compress: bool = compress
+        self.records: int = 0
+        self._file: BinaryIO = open(path, "ab" if append else "wb")
+        self._started: float = time.perf_counter()
+
+    async def request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any) -> TransportResponse:
+        sent_at = time.perf_counter() - self._started
+        response = await self.transport.request(session, method, url, **kwargs)
+        self._write(method, url, kwargs, response, sent_at)
+        return response
+
+    def _write(self, method: str, url: str, kwargs: Dict[str, Any], response: TransportResponse, sent_at: float) -> None:
+        params = kwargs.get("params")
+        body = zlib.compress(response.body) if self.compress else response.body
+        header = {
+            "key": _exchange_key(method, url, params),
+            "at": sent_at,
+            "method": method,
+            "url": url,
+            "params": [[str(k), str(v)] for k, v in params.items()] if params else None,
+            "request_headers": [
+                [k, v] for k, v in (kwargs.get("headers") or {}).items() if k.lower() not in _SECRET_HEADERS
+            ],
+            "status": response.status,
+            "reason": response.reason,
+            "headers": [[k, v] for k, v in response.headers.items()],
+            "elapsed": response.elapsed,
+            "download": response.download,
+            "encoding": "zlib" if self.compress else None,
+            "size": len(body),
+        }
+        self._file.write(_to_json(header).encode("utf-8") + b"\n" + body)
+        self.records += 1
+
+    async def close(self) -> None:
+        self._file.close()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Serves the responses of a recording made with :class:`RecordingTransport`
+    without sending anything over the network.
+
+    Requests are matched by method, URL and query parameters. Repeated requests
+    receive the recorded responses in the order they were recorded; once those
+    run out the last one is served again. Only the offsets of the records are
+    kept in memory, bodies are read from the file when they are served.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The recording to replay.
+    latency_scale: :class:`float`
+        The factor applied to the recorded latencies. ``1`` replays them as recorded,
+        ``0.5`` twice as fast and ``0`` answers immediately. Defaults to 1.
+    repeat: :class:`bool`
+        Whether the last response for a request is served again once the recorded ones
+        are used up. Defaults to ``True``.
+
+    Raises
+    ------
+    LookupError
+        A request was made that is not part of the recording.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, latency_scale: float = 1.0, repeat: bool = True) -> None:
+        self.latency_scale: float = latency_scale
+        self.repeat: bool = repeat
+        self._file: BinaryIO = open(path, "rb")
+        self._index: Dict[str, Deque[int]] = {}
+        self._last: Dict[str, int] = {}
+        self._scan()
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values())
+
+    def _scan(self) -> None:
+        file = self._file
+        end = os.fstat(file.fileno()).st_size
+        while True:
+            offset = file.tell()
+            line = file.readline()
+            if not line.endswith(b"\n"):
+                break
+            header = _from_json(line)
+            if file.tell() + header["size"] > end:
+                # The recording was cut off in the middle of a body
+                _log.warning(f"The recording is truncated after {len(self)} records")
+                break
+            file.seek(header["size"], io.SEEK_CUR)
+            self._index.setdefault(header["key"], deque()).append(offset)
+
+    def _read(self, offset: int) -> TransportResponse:
+        self._file.seek(offset)
+        header = _from_json(self._file.readline())
+        body = self._file.read(header["size"])
+        if header["encoding"] == "zlib":
+            body = zlib.decompress(body)
+        return TransportResponse(
+            status=header["status"],
+            reason=header["reason"],
+            headers=CIMultiDictProxy(CIMultiDict(header["headers"])),
+            body=body,
+            elapsed=header["elapsed"] * self.latency_scale,
+            download=header["download"] * self.latency_scale,
+        )
+
+    async def request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any) -> TransportResponse:
+        key = _exchange_key(method, url, kwargs.get("params"))
+        offsets = self._index.get(key)
+        if offsets:
+            offset = self._last[key] = offsets.popleft()
+        elif self.repeat and key in self._last:
+            offset = self._last[key]
+        else:
+            raise LookupError(f"{key} is not part of the recording")
+
+        response = self._read(offset)
+        if response.elapsed > 0:
+            await asyncio.sleep(response.elapsed)
+        return response
+
+    async def close(self) -> None:
+        self._file.close()
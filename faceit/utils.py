@@ -0,0 +1,128 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import datetime
+import email.utils
+import json
+import sys
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+__all__ = ()
+
+
+if HAS_ORJSON:
+
+    def _to_json(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _from_json = orjson.loads  # type: ignore
+
+else:
+
+    def _to_json(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
+
+    def _from_json(data: Union[str, bytes, bytearray]) -> Any:
+        # json.loads detects the encoding of bytes itself, no need to decode them first
+        return json.loads(data)
+
+
+def _intern(value: Any) -> Any:
+    # Low-cardinality strings such as regions or statuses then share one object across all models
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_retry_after(value: Optional[str], default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max((when - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+
+
+# Model class -> (slots holding payload fields, slots holding memoized sub-objects)
+_MODEL_SLOTS: Dict[type, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
+class _Model:
+    """Serialization support shared by the models.
+
+    Models keep every payload field in a slot named after it with a leading
+    underscore, plus ``_cached_*`` slots for sub-objects built on first access.
+    Pickling only stores the payload fields; the sub-objects are rebuilt lazily.
+    """
+
+    __slots__ = ()
+
+    # Slots whose payload key is not the slot name without its underscore
+    _PAYLOAD_KEYS: Dict[str, str] = {}
+
+    @classmethod
+    def _slots(cls) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        slots = _MODEL_SLOTS.get(cls)
+        if slots is None:
+            names = [name for klass in reversed(cls.__mro__) for name in getattr(klass, "__slots__", ())]
+            fields = tuple(name for name in names if not name.startswith("_cached_") and name != "__weakref__")
+            cached = tuple(name for name in names if name.startswith("_cached_"))
+            slots = _MODEL_SLOTS[cls] = (fields, cached)
+        return slots
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple([getattr(self, name) for name in self._slots()[0]])
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        fields, cached = self._slots()
+        if len(state) != len(fields):
+            raise ValueError(f"{type(self).__name__} expects {len(fields)} fields, got {len(state)}")
+        for name, value in zip(fields, state):
+            object.__setattr__(self, name, value)
+        for name in cached:
+            object.__setattr__(self, name, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the payload the model was built from, ``Model.from_dict(model.to_dict())``
+        gives an equal model.
+
+        Nested objects are the raw payloads, so the result must not be mutated.
+        """
+        keys = self._PAYLOAD_KEYS
+        return {keys.get(name, name[1:]): getattr(self, name) for name in self._slots()[0]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Any:
+        """Build the model from a payload, e.g. one returned by :meth:`to_dict`."""
+        return cls(data=data)
@@ -0,0 +1,254 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import aiohttp
+
+from .bulk import BulkResult
+from .cache import CachePolicy
+from .errors import CircuitBreakerOpen, HTTPException, NotFound
+from .match import Match
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = ("MatchWatcher",)
+
+
+_log = logging.getLogger(__name__)
+
+
+class _Watch:
+    __slots__ = (
+        "match_id",
+        "seq",
+        "due",
+        "status",
+        "failures",
+    )
+
+    def __init__(self, match_id: str) -> None:
+        self.match_id: str = match_id
+        self.seq: int = 0
+        self.due: float = 0.0
+        self.status: Optional[str] = None
+        self.failures: int = 0
+
+
+class MatchWatcher:
+    """Polls many matches until they are over, each as often as its state calls for.
+
+    Every watched match sits in a heap ordered by the time of its next poll, so
+    the cost of scheduling grows with the logarithm of the number of matches and
+    the watcher only wakes up when a poll is due. All polls that are due are
+    started at once, up to ``concurrency`` in flight, and go through the rate
+    limiter of the client like any other request.
+
+    The interval after each poll comes from :meth:`interval_for`: matches that are
+    over are no longer polled, ongoing matches are polled often once they could
+    be over, and matches that have not started yet are polled less often the
+    further away their ``scheduled_at`` is.
+
+    .. code-block:: python3
+
+        watcher = faceit.MatchWatcher(client)
+        watcher.watch_many(match_ids)
+        async for result in watcher:
+            if result.ok:
+                print(result.result.match_id, result.result.status)
+
+    Iteration ends once no match is watched anymore.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to poll with.
+    concurrency: :class:`int`
+        The maximum number of polls in flight. Defaults to 10.
+    ongoing_interval: :class:`float`
+        Seconds between polls of an ongoing match that could end any moment. Defaults to 10.
+    starting_interval: :class:`float`
+        Seconds between polls of a match that is about to start or in check-in, voting or
+        configuration. Defaults to 30.
+    max_interval: :class:`float`
+        The longest interval between two polls. Defaults to 600.
+    map_duration: :class:`float`
+        The shortest time in seconds a single map takes. Ongoing matches are polled at a
+        slower pace until enough maps could have been played for the match to be decided.
+        Defaults to 1200.
+    raw: Optional[:class:`bool`]
+        Yield the decoded JSON payloads instead of :class:`Match`. Defaults to the
+        ``raw`` setting of the client.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        *,
+        concurrency: int = 10,
+        ongoing_interval: float = 10.0,
+        starting_interval: float = 30.0,
+        max_interval: float = 600.0,
+        map_duration: float = 1200.0,
+        raw: Optional[bool] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client: "Client" = client
+        self.concurrency: int = concurrency
+        self.ongoing_interval: float = ongoing_interval
+        self.starting_interval: float = starting_interval
+        self.max_interval: float = max_interval
+        self.map_duration: float = map_duration
+        self.raw: Optional[bool] = raw
+        self.polls: int = 0
+        self._watches: Dict[str, _Watch] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __repr__(self) -> str:
+        return f"<MatchWatcher watched={len(self._watches)} polls={self.polls}>"
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._watches
+
+    def watch(self, match_id: str, *, delay: float = 0.0) -> None:
+        """Start polling a match, the first time after ``delay`` seconds. Does nothing if
+        the match is already watched.
+        """
+        if match_id in self._watches:
+            return
+        watch = self._watches[match_id] = _Watch(match_id)
+        self._schedule(watch, delay)
+
+    def watch_many(self, match_ids: Iterable[str]) -> None:
+        """Start polling every match in ``match_ids`` right away."""
+        for match_id in match_ids:
+            self.watch(match_id)
+
+    def unwatch(self, match_id: str) -> None:
+        """Stop polling a match."""
+        # Its heap entry is skipped once it comes up
+        self._watches.pop(match_id, None)
+
+    def _schedule(self, watch: _Watch, delay: float) -> None:
+        watch.seq = next(self._seq)
+        watch.due = time.monotonic() + delay
+        heapq.heappush(self._heap, (watch.due, watch.seq, watch.match_id))
+        self._wakeup.set()
+
+    def interval_for(self, data: Dict[str, Any]) -> Optional[float]:
+        """Return the number of seconds until the next poll of a match, or ``None`` to
+        stop polling it.
+
+        ``data`` is the decoded match payload. Override this to change the pacing.
+        """
+        status = data.get("status")
+        if status in CachePolicy.FINAL_MATCH_STATUSES:
+            return None
+
+        now = time.time()
+        if status == "ONGOING":
+            started_at = data.get("started_at")
+            if started_at:
+                # A best of N is decided after N // 2 + 1 maps at the earliest
+                earliest_end = started_at + ((data.get("best_of") or 1) // 2 + 1) * self.map_duration
+                if earliest_end > now:
+                    return min(max(earliest_end - now, self.ongoing_interval), self.max_interval)
+            return self.ongoing_interval
+
+        scheduled_at = data.get("scheduled_at")
+        if scheduled_at and scheduled_at > now:
+            # Halve the distance with every poll while approaching the start
+            return min(max((scheduled_at - now) / 2, self.starting_interval), self.max_interval)
+        return self.starting_interval
+
+    async def _poll(self, watch: _Watch) -> BulkResult[str, Union[Match, Dict[str, Any]]]:
+        self.polls += 1
+        try:
+            data = await self.client.http.get_match(watch.match_id)
+        except (HTTPException, CircuitBreakerOpen, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if isinstance(exc, NotFound):
+                self.unwatch(watch.match_id)
+            elif self._watches.get(watch.match_id) is watch:
+                watch.failures += 1
+                self._schedule(watch, min(self.starting_interval * 2 ** (watch.failures - 1), self.max_interval))
+            return BulkResult(watch.match_id, error=exc)
+
+        watch.failures = 0
+        watch.status = data.get("status")
+        interval = self.interval_for(data)
+        if self._watches.get(watch.match_id) is watch:
+            if interval is None:
+                _log.debug(f"Match {watch.match_id} is {watch.status}, no longer watching it")
+                del self._watches[watch.match_id]
+            else:
+                self._schedule(watch, interval)
+        return BulkResult(watch.match_id, result=self.client._wrap(Match, data, self.raw))
+
+    def _start_due(self, pending: Set["asyncio.Task[Any]"]) -> None:
+        heap = self._heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now and len(pending) < self.concurrency:
+            _, seq, match_id = heapq.heappop(heap)
+            watch = self._watches.get(match_id)
+            if watch is None or watch.seq != seq:
+                continue
+            pending.add(asyncio.create_task(self._poll(watch)))
+
+    def __aiter__(self) -> AsyncIterator[BulkResult[str, Union[Match, Dict[str, Any]]]]:
+        return self._run()
+
+    async def _run(self) -> AsyncIterator[BulkResult[str, Union[Match, Dict[str, Any]]]]:
+        pending: Set[asyncio.Task[BulkResult[str, Union[Match, Dict[str, Any]]]]] = set()
+        try:
+            while self._watches or pending:
+                self._wakeup.clear()
+                self._start_due(pending)
+                timeout = None
+                if self._heap and len(pending) < self.concurrency:
+                    timeout = max(self._heap[0][0] - time.monotonic(), 0.0)
+                # Also wake up when a match is watched or rescheduled in the meantime
+                wakeup = asyncio.ensure_future(self._wakeup.wait())
+                done, _ = await asyncio.wait({*pending, wakeup}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                wakeup.cancel()
+                for task in done:
+                    if task is not wakeup:
+                        pending.discard(task)
+                        yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
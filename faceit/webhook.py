@@ -0,0 +1,339 @@
+"""
+MIT License
+
+Copyright (c) 2025-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import hmac
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from .http import Route
+from .match import Match
+from .player import Player
+from .utils import _from_json
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = (
+    "WebhookEvent",
+    "WebhookReceiver",
+)
+
+
+_log = logging.getLogger(__name__)
+
+WebhookHandler = Callable[["WebhookEvent"], Awaitable[Any]]
+
+# The payload fields that mean the same as in the Data API and are copied onto the models
+_MATCH_FIELDS = ("organizer_id", "region", "game", "version")
+_PLAYER_FIELDS = ("nickname", "avatar", "country")
+
+# Hosts start() may serve on without a secret
+_LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+class WebhookEvent:
+    """An event FACEIT pushed to a :class:`WebhookReceiver`.
+
+    Attributes
+    ----------
+    event: :class:`str`
+        The type of the event, e.g. ``match_status_finished``.
+    event_id: :class:`str`
+        The ID of the event. Retried deliveries share it.
+    transaction_id: Optional[:class:`str`]
+        The ID of the delivery.
+    timestamp: Optional[:class:`str`]
+        When the event happened, as an ISO 8601 string.
+    retry_count: :class:`int`
+        How often the delivery was retried.
+    payload: Dict[:class:`str`, Any]
+        The raw payload of the event.
+    """
+
+    __slots__ = (
+        "event",
+        "event_id",
+        "transaction_id",
+        "timestamp",
+        "retry_count",
+        "payload",
+        "_cached_match",
+        "_cached_player",
+    )
+
+    def __init__(self, *, data: Dict[str, Any]) -> None:
+        self.event: str = data["event"]
+        self.event_id: str = data["event_id"]
+        self.transaction_id: Optional[str] = data.get("transaction_id")
+        self.timestamp: Optional[str] = data.get("timestamp")
+        self.retry_count: int = data.get("retry_count") or 0
+        self.payload: Dict[str, Any] = data.get("payload") or {}
+        if not isinstance(self.event, str) or not isinstance(self.event_id, str) or not isinstance(self.payload, dict):
+            raise TypeError("a webhook event needs a string event type and ID and an object payload")
+        self._cached_match = None
+        self._cached_player = None
+
+    def __repr__(self) -> str:
+        return f"<WebhookEvent event={self.event!r} event_id={self.event_id!r}>"
+
+    @property
+    def match_id(self) -> Optional[str]:
+        """The ID of the match, for ``match_*`` events."""
+        return self.payload.get("id") if self.event.startswith("match_") else None
+
+    @property
+    def player_id(self) -> Optional[str]:
+        """The ID of the player, for events about a single user."""
+        return self.payload.get("user_id") or self.payload.get("player_id")
+
+    @property
+    def match(self) -> Optional[Match]:
+        """The match of a ``match_*`` event.
+
+        Webhook payloads only carry a subset of the fields of :meth:`Client.get_match`,
+        the others are ``None``. For ``match_status_*`` events the status is taken from
+        the event type.
+        """
+        if self._cached_match is None and self.match_id is not None:
+            data = {key: self.payload[key] for key in _MATCH_FIELDS if key in self.payload}
+            data["match_id"] = self.match_id
+            if self.event.startswith("match_status_"):
+                data["status"] = self.event[len("match_status_") :].upper()
+            self._cached_match = Match(data=data)
+        return self._cached_match
+
+    @property
+    def player(self) -> Optional[Player]:
+        """The player of an event about a single user, with the fields the payload carries."""
+        if self._cached_player is None and self.player_id is not None:
+            data = {key: self.payload[key] for key in _PLAYER_FIELDS if key in self.payload}
+            data["player_id"] = self.player_id
+            self._cached_player = Player(data=data)
+        return self._cached_player
+
+
+class WebhookReceiver:
+    """Receives the events FACEIT pushes to a webhook, so live matches don't have to be polled.
+
+    The receiver is an :class:`aiohttp.web.Application` route that can run on its
+    own with :meth:`start` or be added to an existing application with
+    :meth:`add_routes`. Every valid delivery is acknowledged as soon as it is put
+    into a bounded queue, and a fixed number of workers pass the queued events to
+    the registered handlers. When handlers fall behind and the queue stays full for
+    ``enqueue_timeout`` seconds, deliveries are answered with 503 so FACEIT retries
+    them later. Retried deliveries of an event that was already accepted are dropped.
+
+    If a client is given, its cached responses for the match or player of an event
+    are dropped, so the next request fetches the new state.
+
+    .. code-block:: python3
+
+        receiver = faceit.WebhookReceiver(client, secret="...")
+
+        @receiver.on("match_status_finished")
+        async def on_finished(event):
+            print(event.match.match_id)
+
+        await receiver.start(port=8080)
+
+    Parameters
+    ----------
+    client: Optional[:class:`Client`]
+        The client whose cache is kept up to date.
+    secret: Optional[:class:`str`]
+        The value of ``secret_header`` configured for the webhook. Deliveries without it
+        are rejected with 401. ``None`` accepts every delivery, and is only allowed
+        by :meth:`start` on a loopback host.
+    secret_header: :class:`str`
+        The header carrying the secret. Defaults to ``Authorization``.
+    path: :class:`str`
+        The path deliveries are posted to. Defaults to ``/faceit/webhook``.
+    queue_size: :class:`int`
+        The number of events that may wait for a handler. Defaults to 1000.
+    workers: :class:`int`
+        The number of events handled concurrently. Defaults to 4.
+    enqueue_timeout: :class:`float`
+        Seconds a delivery waits for room in the queue before it is refused. Defaults to 1.
+    """
+
+    # The number of recently accepted event IDs that are remembered to drop retried deliveries
+    SEEN_EVENTS = 10_000
+
+    def __init__(
+        self,
+        client: Optional["Client"] = None,
+        *,
+        secret: Optional[str] = None,
+        secret_header: str = "Authorization",
+        path: str = "/faceit/webhook",
+        queue_size: int = 1000,
+        workers: int = 4,
+        enqueue_timeout: float = 1.0,
+    ) -> None:
+        self.client: Optional["Client"] = client
+        self.secret: Optional[str] = secret
+        self.secret_header: str = secret_header
+        self.path: str = path
+        self.workers: int = workers
+        self.enqueue_timeout: float = enqueue_timeout
+        self.queue: "asyncio.Queue[WebhookEvent]" = asyncio.Queue(maxsize=queue_size)
+        self.received: int = 0
+        self.rejected: int = 0
+        self.duplicates: int = 0
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def __repr__(self) -> str:
+        return f"<WebhookReceiver path={self.path!r} queued={self.queue.qsize()} received={self.received}>"
+
+    def add_handler(self, event: str, handler: WebhookHandler) -> None:
+        """Call the coroutine function ``handler`` with every event of type ``event``.
+        ``*`` matches every event.
+        """
+        self._handlers.setdefault(event, []).append(handler)
+
+    def on(self, event: str) -> Callable[[WebhookHandler], WebhookHandler]:
+        """A decorator that registers a handler, see :meth:`add_handler`."""
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(event, handler)
+            return handler
+
+        return decorator
+
+    def add_routes(self, app: web.Application) -> None:
+        """Add the webhook route to an existing application and handle events while it runs."""
+        app.router.add_post(self.path, self._receive)
+        app.on_startup.append(lambda app: self.start_workers())
+        app.on_cleanup.append(lambda app: self.stop_workers())
+
+    def app(self) -> web.Application:
+        """Return an application that only serves the webhook."""
+        app = web.Application()
+        self.add_routes(app)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> Tuple[str, int]:
+        """*coroutine*
+        Start serving the webhook on its own and return the address it listens on.
+        Port 0 picks a free port. Only loopback hosts may be served without a secret.
+
+        Raises
+        ------
+        ValueError
+            ``host`` is not a loopback address and no secret was given.
+        """
+        if self.secret is None and host not in _LOOPBACK_HOSTS:
+            raise ValueError(f"refusing to serve the webhook on {host!r} without a secret")
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][:2]
+
+    async def stop(self) -> None:
+        """*coroutine*
+        Stop serving the webhook started with :meth:`start`.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def start_workers(self) -> None:
+        """*coroutine*
+        Start the workers that pass queued events to the handlers.
+        """
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop_workers(self) -> None:
+        """*coroutine*
+        Handle the events that are still queued, then stop the workers.
+        """
+        await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _authorized(self, request: web.Request) -> bool:
+        if self.secret is None:
+            return True
+        # Compared as bytes, compare_digest refuses non-ASCII str and invalid header bytes arrive surrogate-escaped
+        received = request.headers.get(self.secret_header, "").encode("utf-8", "surrogateescape")
+        return hmac.compare_digest(received, self.secret.encode())
+
+    async def _receive(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            self.rejected += 1
+            return web.Response(status=401)
+        try:
+            event = WebhookEvent(data=_from_json(await request.read()))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.rejected += 1
+            return web.Response(status=400)
+
+        if event.event_id in self._seen:
+            self.duplicates += 1
+            return web.Response(status=200)
+        try:
+            await asyncio.wait_for(self.queue.put(event), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            _log.warning(f"The webhook queue is full, refusing {event!r}")
+            return web.Response(status=503)
+
+        self.received += 1
+        self._seen[event.event_id] = None
+        if len(self._seen) > self.SEEN_EVENTS:
+            self._seen.popitem(last=False)
+        self._invalidate(event)
+        return web.Response(status=200)
+
+    def _invalidate(self, event: WebhookEvent) -> None:
+        if self.client is None:
+            return
+        http = self.client.http
+        if event.match_id is not None:
+            http.invalidate(Route("GET", "/matches/{match_id}", match_id=event.match_id))
+            http.invalidate(Route("GET", "/matches/{match_id}/stats", match_id=event.match_id))
+        if event.player_id is not None:
+            http.invalidate(Route("GET", "/players/{player_id}", player_id=event.player_id))
+
+    async def _work(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                for handler in self._handlers.get(event.event, []) + self._handlers.get("*", []):
+                    try:
+                        await handler(event)
+                    except Exception:
+                        _log.exception(f"Handler {handler!r} failed on {event!r}")
+            finally:
+                self.queue.task_done()